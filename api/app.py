@@ -14,20 +14,22 @@ Run (Docker entrypoint handles this automatically alongside the GUI).
 
 from __future__ import annotations
 import os
-import json
 import sys
 import logging
 from pathlib import Path
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import RedirectResponse
+
+from .responses import ORJSONResponse
 
 # ── Bootstrap: inject saved API keys into env before core modules import ──────
 _settings_path = Path.home() / ".mediarenamer" / "settings.json"
 if _settings_path.exists():
     try:
-        _s = json.loads(_settings_path.read_text())
+        _s = orjson.loads(_settings_path.read_bytes())
         for _env, _key in [("TMDB_API_KEY","tmdb_api_key"),
                             ("TVDB_API_KEY","tvdb_api_key"),
                             ("OPENSUBTITLES_API_KEY","opensubtitles_api_key")]:
@@ -54,6 +56,7 @@ app = FastAPI(
     license_info= {"name": "MIT"},
     docs_url    = "/docs",
     redoc_url   = "/redoc",
+    default_response_class = ORJSONResponse,
 )
 
 # Allow all origins for local/Docker use — tighten in production
@@ -70,6 +73,7 @@ from .routes.media   import router as media_router
 from .routes.jobs    import router as jobs_router
 from .routes.library import presets_router, history_router
 from .models         import HealthResponse, PresetCreateRequest
+from .deps           import get_matcher
 
 PREFIX = "/api/v1"
 app.include_router(media_router,   prefix=PREFIX)
@@ -92,14 +96,15 @@ def set_keys(tmdb: str | None = None, tvdb: str | None = None, opensubtitles: st
     s: dict = {}
     if _settings_path.exists():
         try:
-            s = json.loads(_settings_path.read_text())
+            s = orjson.loads(_settings_path.read_bytes())
         except Exception:
             pass
     if tmdb:           s["tmdb_api_key"]           = tmdb;           os.environ["TMDB_API_KEY"]           = tmdb
     if tvdb:           s["tvdb_api_key"]            = tvdb;           os.environ["TVDB_API_KEY"]           = tvdb
     if opensubtitles:  s["opensubtitles_api_key"]   = opensubtitles;  os.environ["OPENSUBTITLES_API_KEY"]  = opensubtitles
     _settings_path.parent.mkdir(parents=True, exist_ok=True)
-    _settings_path.write_text(json.dumps(s, indent=2))
+    _settings_path.write_bytes(orjson.dumps(s, option=orjson.OPT_INDENT_2))
+    get_matcher.cache_clear()   # the cached matcher holds the old keys
     return {"status": "ok", "keys_updated": [k for k, v in {"tmdb": tmdb, "tvdb": tvdb, "opensubtitles": opensubtitles}.items() if v]}
 
 app.include_router(settings_router)
@@ -162,4 +167,4 @@ def naming_tokens():
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     logging.exception("Unhandled exception in %s", request.url)
-    return JSONResponse(status_code=500, content={"detail": str(exc)})
+    return ORJSONResponse(status_code=500, content={"detail": str(exc)})
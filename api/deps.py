@@ -0,0 +1,42 @@
+"""
+Shared core objects for route handlers, injected with ``Depends``.
+
+Each is built once per process instead of once per request. History and
+presets are re-read only when their file changes on disk (the GUI may write
+them too); the matcher is rebuilt after API keys change (set_keys calls
+get_matcher.cache_clear()).
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_matcher():
+    from core.matcher import MediaMatcher
+    return MediaMatcher()
+
+
+@lru_cache(maxsize=1)
+def _preset_manager():
+    from core.presets import PresetManager
+    return PresetManager()
+
+
+@lru_cache(maxsize=1)
+def _history():
+    from core.history import RenameHistory
+    return RenameHistory()
+
+
+def get_pm():
+    pm = _preset_manager()
+    pm.reload_if_changed()
+    return pm
+
+
+def get_hist():
+    h = _history()
+    h.reload_if_changed()
+    return h
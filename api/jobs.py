@@ -1,23 +1,32 @@
 """
 Async job queue for batch rename operations.
-Jobs run in background threads; state is held in-memory
-(and optionally flushed to ~/.mediarenamer/jobs.json for persistence).
+Jobs run in background threads; state is held in-memory and flushed in
+batches to a job store (~/.mediarenamer/jobs.json by default, or Redis via
+MR_STORE — see store.py) so job history survives a restart.
 """
 
 from __future__ import annotations
 
 import os
 import json
-import shutil
+import atexit
+import logging
 import hashlib
 import threading
 import time
-import uuid
+import base64
+import itertools
+from collections import OrderedDict, deque
+from queue import Queue, Empty, Full
 import requests as _requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional, List, Callable
+from typing import Optional, List, Callable, Iterator
 
+from .store import JobStore, get_store
 from .models import (
     JobRequest, JobSummary, JobDetail, JobStatus, JobProgress,
     RenameResult, MatchInfo, FileOperation,
@@ -26,15 +35,84 @@ from .models import (
 # Shared core modules
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.renamer import copy_file, move_file  # noqa: E402
+from core.scanner import is_media, skip_dir  # noqa: E402
+
+log = logging.getLogger(__name__)
+
+RESULTS_DIR    = Path.home() / ".mediarenamer" / "jobs"   # {job_id}.ndjson
+FLUSH_INTERVAL = 2.0   # seconds between batched writes of job state
+FLUSH_EVERY    = 50    # ...or sooner, after this many state changes
+
+_versions = itertools.count(1)
+_MATCHINFO_FIELDS = frozenset(MatchInfo.model_fields)   # keys copied from match dicts (already typed)
+TERMINAL_STATES   = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+
+
+# Job ids: a counter seeded from the start-up time in ms, shifted left with
+# 10 bits of the pid below it so API workers sharing a store don't collide.
+# 64 bits → 13 Crockford base32 chars that sort in submission order.
+_id_ctr = itertools.count(int(time.time() * 1000) << 10)
+_id_tag = os.getpid() & 0x3FF
+_B32_CROCKFORD = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567",
+                                 b"0123456789ABCDEFGHJKMNPQRSTVWXYZ")
+
+
+def _new_job_id() -> str:
+    n = (next(_id_ctr) << 10) | _id_tag
+    return base64.b32encode(n.to_bytes(8, "big"))[:13].translate(_B32_CROCKFORD).decode()
 
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+_ts_cache = (0, "")   # (epoch second, "HH:MM:SS") — swapped whole, so no lock
+
+def _log_timestamp() -> str:
+    """Local wall-clock time for log lines, formatted at most once a second."""
+    global _ts_cache
+    sec    = int(time.time())
+    cached = _ts_cache
+    if cached[0] != sec:
+        cached    = (sec, time.strftime("%H:%M:%S", time.localtime(sec)))
+        _ts_cache = cached
+    return cached[1]
+
+
+# Per-file work (TMDB lookups, moves, artwork) is I/O-bound, so files from
+# every job are fanned out over one shared, bounded pool of worker threads.
+_io_pool = ThreadPoolExecutor(max_workers=int(os.getenv("MR_JOB_WORKERS", "8")),
+                              thread_name_prefix="mr-job-io")
+
+# Job coordinators only dispatch to _io_pool and fold results, so a few
+# threads serve every job; jobs beyond this stay PENDING until one frees up.
+_job_pool = ThreadPoolExecutor(max_workers=int(os.getenv("MR_MAX_RUNNING_JOBS", "4")),
+                               thread_name_prefix="mr-job")
+
+# Directory listing for job inputs: each task scandirs one directory and
+# hands its subdirectories back to the pool, so wide trees are walked in
+# parallel and files reach _io_pool while the scan is still running.
+_scan_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mr-scan")
+
+# One keep-alive session for webhooks and job matching, so repeated calls
+# reuse pooled connections instead of paying a TCP+TLS handshake each time.
+_session = _requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16, pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504],
+                      raise_on_status=False),   # let MediaMatcher._get report the status
+)
+_session.mount("https://", _adapter)
+_session.mount("http://",  _adapter)
+
+
 class Job:
     """Represents one batch rename job."""
 
+    MAX_LOG_LINES = 200   # older log lines are dropped as new ones arrive
+    MAX_RESULTS   = 200   # recent results kept in memory; all go to results_path
+
     def __init__(self, job_id: str, request: JobRequest):
         self.job_id      = job_id
         self.request     = request
@@ -43,8 +121,8 @@ class Job:
         self.started_at: Optional[datetime]   = None
         self.completed_at: Optional[datetime] = None
         self.progress    = JobProgress(current=0, total=0, percent=0.0)
-        self.results: List[RenameResult]      = []
-        self.log: List[str]                   = []
+        self.results: deque                   = deque(maxlen=self.MAX_RESULTS)
+        self.log: deque                       = deque(maxlen=self.MAX_LOG_LINES)
         self.renamed_count   = 0
         self.error_count     = 0
         self.conflict_count  = 0
@@ -52,93 +130,340 @@ class Job:
         self.error: Optional[str]             = None
         self._cancelled      = False
         self._lock           = threading.Lock()
+        self._results_fh     = None    # append-only NDJSON writer, opened lazily
+        self._claimed: set   = set()   # destinations reserved by in-flight files
+        self._made_dirs: set = set()   # destination dirs already created
+        self._version        = 0       # bumped on every summary-visible change
+        self._summary_cache: Optional[tuple] = None   # (version, dict)
 
     def cancel(self):
         with self._lock:
             if self.status in (JobStatus.PENDING, JobStatus.RUNNING):
                 self._cancelled = True
                 self.status = JobStatus.CANCELLED
+                self._changed()
 
     def to_summary(self) -> JobSummary:
+        # Copy under the job lock so progress and counters are read as one
+        # consistent set while workers are folding in results.
+        with self._lock:
+            fields = dict(
+                status        = self.status,
+                started_at    = self.started_at,
+                completed_at  = self.completed_at,
+                progress      = self.progress.model_copy(),
+                renamed_count = self.renamed_count,
+                error_count   = self.error_count,
+                conflict_count= self.conflict_count,
+                last_message  = self.last_message,
+                error         = self.error,
+            )
         return JobSummary(
-            job_id        = self.job_id,
-            status        = self.status,
-            created_at    = self.created_at,
-            started_at    = self.started_at,
-            completed_at  = self.completed_at,
-            progress      = self.progress,
-            file_count    = len(self.request.files),
-            renamed_count = self.renamed_count,
-            error_count   = self.error_count,
-            conflict_count= self.conflict_count,
-            last_message  = self.last_message,
-            error         = self.error,
+            job_id     = self.job_id,
+            created_at = self.created_at,
+            file_count = len(self.request.files),
+            **fields,
         )
 
+    def to_summary_dict(self) -> dict:
+        """JSON-ready summary, rebuilt only if the job changed since the last call."""
+        version = self._version
+        cached  = self._summary_cache
+        if cached is None or cached[0] != version:
+            cached = (version, self.to_summary().model_dump(mode="json"))
+            self._summary_cache = cached
+        return cached[1]
+
     def to_detail(self) -> JobDetail:
         return JobDetail(
             **self.to_summary().model_dump(),
             request = self.request,
-            results = self.results,
-            log     = self.log[-200:],  # cap at 200 log lines
+            results = list(self.results),
+            log     = list(self.log),
         )
 
+    def to_detail_dict(self) -> dict:
+        """JSON-ready ``JobDetail`` without building the model first."""
+        d = dict(self.to_summary_dict())
+        d["request"] = self.request.model_dump(mode="json")
+        d["results"] = [r.model_dump(mode="json") for r in list(self.results)]
+        d["log"]     = list(self.log)
+        return d
+
+    @classmethod
+    def from_detail(cls, data: dict, interrupted: bool = True) -> "Job":
+        """Rebuild a job from a persisted ``JobDetail`` snapshot.
+
+        With *interrupted*, a snapshot still pending/running is marked failed —
+        its worker died with the process that wrote it.
+        """
+        d   = JobDetail.model_validate(data)
+        job = cls(d.job_id, d.request)
+        job.status         = d.status
+        job.created_at     = d.created_at
+        job.started_at     = d.started_at
+        job.completed_at   = d.completed_at
+        job.progress       = d.progress
+        job.results.extend(d.results)
+        job.log.extend(d.log)
+        job.renamed_count  = d.renamed_count
+        job.error_count    = d.error_count
+        job.conflict_count = d.conflict_count
+        job.last_message   = d.last_message
+        job.error          = d.error
+        if interrupted and job.status in (JobStatus.PENDING, JobStatus.RUNNING):
+            job.status = JobStatus.FAILED
+            job.error  = job.error or "Interrupted by server restart"
+        return job
+
+    @property
+    def results_path(self) -> Path:
+        """Every per-file result of the job, one JSON object per line."""
+        return RESULTS_DIR / f"{self.job_id}.ndjson"
+
+    def flush_results(self):
+        fh = self._results_fh
+        if fh:
+            fh.flush()
+
+    def discard_results(self):
+        self._close_results()
+        self.results_path.unlink(missing_ok=True)
+
+    def _record(self, res: RenameResult):
+        """Keep *res* in the recent window and append it to results_path."""
+        self.results.append(res)
+        try:
+            if self._results_fh is None:
+                RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+                self._results_fh = open(self.results_path, "ab", buffering=1 << 16)
+            self._results_fh.write(res.model_dump_json().encode() + b"\n")
+        except OSError as exc:
+            log.warning("Could not write results for job %s: %s", self.job_id, exc)
+
+    def _close_results(self):
+        fh, self._results_fh = self._results_fh, None
+        if fh:
+            fh.close()
+
+    def _changed(self):
+        # next() on a shared count is atomic, unlike += from several workers
+        self._version = next(_versions)
+
     def _append_log(self, msg: str):
         self.last_message = msg
-        self.log.append(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+        self._changed()
+        self.log.append(f"[{_log_timestamp()}] {msg}")
 
 
 class JobQueue:
-    """Thread-safe in-memory job queue with background execution."""
+    """Thread-safe in-memory job queue with background execution.
+
+    Reads (get, cancel lookups) go straight to the dict — single-key dict
+    operations are atomic — and _lock is held only to add or remove jobs or
+    to copy the job list. Per-job state is guarded by each Job's own lock.
+    """
 
     MAX_JOBS = 200   # keep at most this many jobs in memory
 
-    def __init__(self):
-        self._jobs: Dict[str, Job] = {}
+    def __init__(self, store: Optional[JobStore] = None, run_jobs: bool = True):
+        if not run_jobs and not (store and store.shared):
+            raise RuntimeError(
+                "MR_JOB_RUNNER=external needs a shared job store — set MR_STORE=redis://..."
+            )
+        # Insertion order doubles as eviction order: finished jobs are moved
+        # to the end, so the oldest-finished sit at the front.
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
         self._lock = threading.Lock()
+        self._run_jobs = run_jobs
+        self._store   = store
+        self._changes = 0
+        self._changes_lock = threading.Lock()
+        self._wake    = threading.Event()
+        if store:
+            if not store.shared:
+                # A shared store's jobs belong to whichever worker is running them
+                self._load()
+            # flush() writes only this process's jobs, so it is safe to share
+            threading.Thread(target=self._flush_loop, daemon=True,
+                             name="mr-job-flush").start()
+            atexit.register(self.flush)
 
     # ── Public interface ───────────────────────────────────────────────────────
 
     def submit(self, request: JobRequest) -> Job:
-        job_id = str(uuid.uuid4())
+        job_id = _new_job_id()
         job = Job(job_id, request)
+        if not self._run_jobs:
+            # Enqueue only; worker.py claims it from the shared store
+            self._store.save(job.to_detail().model_dump(mode="json"))
+            return job
         with self._lock:
             self._jobs[job_id] = job
             self._evict_old_jobs()
-        thread = threading.Thread(target=self._run_job, args=(job,), daemon=True)
-        thread.start()
+        self._touch()
+        _job_pool.submit(self._run_job, job)
         return job
 
     def get(self, job_id: str) -> Optional[Job]:
-        return self._jobs.get(job_id)
+        job = self._jobs.get(job_id)
+        if job is None and self._store:
+            # Possibly owned by another API worker sharing the store; this is
+            # a read-only snapshot as of that worker's last flush.
+            try:
+                snap = self._store.load(job_id)
+                job  = Job.from_detail(snap, interrupted=False) if snap else None
+            except Exception as exc:
+                log.warning("Job store lookup failed for %s: %s", job_id, exc)
+        return job
 
     def list_all(self) -> List[Job]:
         with self._lock:
-            return sorted(self._jobs.values(), key=lambda j: j.created_at, reverse=True)
+            jobs = list(self._jobs.values())
+        if self._store and self._store.shared:
+            # Include jobs run by other API workers
+            try:
+                local = {j.job_id for j in jobs}
+                jobs.extend(Job.from_detail(snap, interrupted=False)
+                            for snap in self._store.load_all()
+                            if snap["job_id"] not in local)
+            except Exception as exc:
+                log.warning("Job store listing failed: %s", exc)
+        jobs.sort(key=lambda j: j.created_at, reverse=True)
+        return jobs
 
     def cancel(self, job_id: str) -> bool:
         job = self.get(job_id)
         if job:
             job.cancel()
+            if job_id not in self._jobs and self._store:
+                self._store.request_cancel(job_id)   # owned by another worker
+            self._touch()
             return True
         return False
 
     def delete(self, job_id: str) -> bool:
         with self._lock:
-            if job_id in self._jobs:
-                del self._jobs[job_id]
-                return True
-        return False
+            job = self._jobs.pop(job_id, None)
+        if job is None and self._store and self._store.shared:
+            job = self.get(job_id)
+        deleted = job is not None
+        if deleted:
+            job.discard_results()
+            if self._store:
+                try:
+                    self._store.delete(job_id)
+                except Exception as exc:
+                    log.warning("Job store delete failed for %s: %s", job_id, exc)
+            self._touch()
+        return deleted
+
+    def adopt(self, job: Job):
+        """Run a job claimed from the shared store (see worker.py)."""
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._evict_old_jobs()
+        self._touch(job)
+        _job_pool.submit(self._run_job, job)
+
+    def poll_cancellations(self):
+        """Apply cancels that other processes requested through the store."""
+        with self._lock:
+            active = [j for j in self._jobs.values()
+                      if j.status in (JobStatus.PENDING, JobStatus.RUNNING)]
+        for job in active:
+            if self._store.cancel_requested(job.job_id):
+                job.cancel()
+                self._touch(job)
+
+    def release_finished(self):
+        """Flush, then forget finished jobs — the shared store still has them.
+
+        Progress of running jobs reaches the store through the batched
+        flusher like any other state change; this final flush makes sure a
+        job's terminal state is written before it is dropped.
+        """
+        with self._lock:
+            done = [j for j in self._jobs.values()
+                    if j.completed_at and j.status != JobStatus.RUNNING]
+        if done:
+            self.flush()
+            with self._lock:
+                for j in done:
+                    self._jobs.pop(j.job_id, None)
+
+    def flush(self):
+        """Write a snapshot of every job to the store in a single batch."""
+        if not self._store:
+            return
+        with self._changes_lock:
+            self._changes = 0
+        with self._lock:
+            jobs = list(self._jobs.values())
+        try:
+            self._store.save_all([j.to_detail().model_dump(mode="json") for j in jobs])
+        except Exception as exc:
+            log.warning("Could not persist jobs to %s: %s", self._store, exc)
 
     # ── Internals ──────────────────────────────────────────────────────────────
 
+    def _touch(self, job: Optional[Job] = None):
+        """Record a state change; wake the flusher early once enough pile up."""
+        if job is not None:
+            job._changed()
+        with self._changes_lock:
+            self._changes += 1
+            due = self._changes >= FLUSH_EVERY
+        if due:
+            self._wake.set()
+
+    def _flush_loop(self):
+        while True:
+            self._wake.wait(FLUSH_INTERVAL)
+            self._wake.clear()
+            if self._changes:
+                self.flush()
+
+    def _load(self):
+        try:
+            data = self._store.load_all()
+        except Exception as exc:
+            log.warning("Ignoring unreadable job store %s: %s", self._store, exc)
+            return
+        jobs = []
+        for item in data:
+            try:
+                jobs.append(Job.from_detail(item))
+            except Exception:
+                continue
+        jobs.sort(key=lambda j: j.completed_at or j.created_at)
+        for job in jobs:
+            self._jobs[job.job_id] = job
+
+    def _mark_finished(self, job: Job):
+        """Move *job* to the back of the eviction order."""
+        with self._lock:
+            if job.job_id in self._jobs:
+                self._jobs.move_to_end(job.job_id)
+
     def _evict_old_jobs(self):
-        """Remove completed/failed jobs beyond MAX_JOBS."""
-        completed = [j for j in self._jobs.values()
-                     if j.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)]
-        if len(self._jobs) > self.MAX_JOBS:
-            for old in sorted(completed, key=lambda j: j.created_at)[: len(self._jobs) - self.MAX_JOBS]:
-                del self._jobs[old.job_id]
+        """Remove the longest-finished jobs beyond MAX_JOBS (caller holds _lock).
+
+        Walks from the front only until enough finished jobs are found;
+        pending/running jobs met on the way are skipped, never evicted.
+        """
+        excess = len(self._jobs) - self.MAX_JOBS
+        if excess <= 0:
+            return
+        victims = []
+        for job in self._jobs.values():
+            if job.status in TERMINAL_STATES:
+                victims.append(job)
+                if len(victims) == excess:
+                    break
+        for old in victims:
+            del self._jobs[old.job_id]
+            old.discard_results()
 
     def _run_job(self, job: Job):
         from core.matcher import MediaMatcher
@@ -146,118 +471,264 @@ class JobQueue:
         from core.artwork import ArtworkDownloader
         from core.metadata_writer import MetadataWriter
 
-        job.status     = JobStatus.RUNNING
-        job.started_at = _utcnow()
+        if job._cancelled:   # cancelled while still queued
+            job.completed_at = _utcnow()
+            self._mark_finished(job)
+            self._touch(job)
+            return
+        with job._lock:
+            job.status     = JobStatus.RUNNING
+            job.started_at = _utcnow()
+        self._touch(job)
 
         try:
-            matcher    = MediaMatcher()
+            matcher    = MediaMatcher(session=_session)
             renamer    = FileRenamer(job.request.naming_scheme)
-            artwork_dl = ArtworkDownloader()      if job.request.download_artwork else None
-            meta_wr    = MetadataWriter()         if job.request.write_metadata   else None
-
-            # Expand directory paths to individual files
-            files = _expand_paths(job.request.files)
-            job.progress = JobProgress(current=0, total=len(files), percent=0.0)
-            job._append_log(f"Starting job — {len(files)} file(s)")
-
-            for i, fp in enumerate(files):
+            artwork_dl = ArtworkDownloader(session=_session) if job.request.download_artwork else None
+            meta_wr    = MetadataWriter()                 if job.request.write_metadata   else None
+
+            out_root = os.path.normpath(job.request.output_dir) if job.request.output_dir else None
+            ctx = (matcher, renamer, artwork_dl, meta_wr, out_root)
+            job.progress = JobProgress(current=0, total=0, percent=0.0)
+            job._append_log("Starting job — scanning input paths")
+
+            # Files are dispatched as the scan discovers them; progress is
+            # "done / discovered so far" until the scan finishes.
+            futures: List = []
+            finished: "Queue" = Queue()
+            done = 0
+
+            def collect(fut) -> None:
+                nonlocal done
+                done += 1
+                if fut.cancelled():
+                    return
+                name, res = fut.result()
                 if job._cancelled:
-                    break
-
-                job.progress.current     = i
-                job.progress.percent     = round(i / max(len(files), 1) * 100, 1)
-                job.progress.current_file = os.path.basename(fp)
-
-                try:
-                    mi = matcher.match_file(fp, job.request.data_source, extract_media_info=True)
-                    if not mi:
-                        job._append_log(f"✗  No match: {os.path.basename(fp)}")
-                        job.results.append(RenameResult(original=fp, success=False, dry_run=job.request.dry_run,
-                                                        error="No match found"))
-                        job.error_count += 1
-                        continue
-
-                    new_name  = renamer.generate_new_name(fp, mi, job.request.naming_scheme)
-                    dest_base = Path(job.request.output_dir) if job.request.output_dir else Path(fp).parent
-                    dest      = dest_base / new_name
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-
-                    if dest.exists() and dest != Path(fp) and not job.request.overwrite:
-                        job._append_log(f"⚠  Conflict: {dest.name}")
-                        job.results.append(RenameResult(original=fp, destination=str(dest),
-                                                        success=False, dry_run=job.request.dry_run, conflict=True))
+                    for f in futures:
+                        f.cancel()
+                with job._lock:
+                    job.progress.current      = done
+                    job.progress.percent      = round(done / max(len(futures), 1) * 100, 1)
+                    job.progress.current_file = name
+                    if res is None:
+                        return
+                    job._record(res)
+                    if res.success:
+                        job.renamed_count += 1
+                    elif res.conflict:
                         job.conflict_count += 1
-                        continue
-
-                    if not job.request.dry_run:
-                        if job.request.operation == FileOperation.COPY:
-                            shutil.copy2(fp, str(dest))
-                        else:
-                            shutil.move(fp, str(dest))
-
-                        if artwork_dl:
-                            artwork_dl.download_poster(mi, str(dest.parent))
-                        if meta_wr:
-                            meta_wr.write_metadata(str(dest), mi)
-
-                    mode = "DRY-RUN" if job.request.dry_run else job.request.operation.value.upper()
-                    job._append_log(f"✓  [{mode}] {os.path.basename(fp)} → {dest.name}")
-                    job.renamed_count += 1
-                    job.results.append(RenameResult(
-                        original=fp, destination=str(dest),
-                        success=True, dry_run=job.request.dry_run,
-                        match_info=MatchInfo(**{k: v for k, v in (mi or {}).items()
-                                               if k in MatchInfo.model_fields}),
-                    ))
-
-                except Exception as exc:
-                    job._append_log(f"✗  Error: {os.path.basename(fp)} — {exc}")
-                    job.results.append(RenameResult(original=fp, success=False,
-                                                    dry_run=job.request.dry_run, error=str(exc)))
-                    job.error_count += 1
-
-            job.progress.current = len(files)
-            job.progress.percent = 100.0
-            job.status = JobStatus.CANCELLED if job._cancelled else JobStatus.COMPLETED
+                    else:
+                        job.error_count += 1
+                self._touch(job)
+
+            scan = _iter_media_files(job.request.files)
+            try:
+                for fp in scan:
+                    if job._cancelled:
+                        break
+                    fut = _io_pool.submit(_process_one, job, fp, *ctx)
+                    fut.add_done_callback(finished.put)
+                    futures.append(fut)
+                    job.progress.total = len(futures)
+                    while True:
+                        try:
+                            collect(finished.get_nowait())
+                        except Empty:
+                            break
+            finally:
+                scan.close()
+            job._append_log(f"Scan complete — {len(futures)} file(s)")
+
+            while done < len(futures):
+                collect(finished.get())
+
+            with job._lock:
+                job.progress.current = len(futures)
+                job.progress.percent = 100.0
+                job.status = JobStatus.CANCELLED if job._cancelled else JobStatus.COMPLETED
             summary = f"Done — {job.renamed_count} renamed, {job.error_count} errors, {job.conflict_count} conflicts"
             job._append_log(summary)
 
-            # Fire webhook if configured
-            if job.request.webhook_url and job.status == JobStatus.COMPLETED:
-                _fire_webhook(job)
-
         except Exception as exc:
-            job.status = JobStatus.FAILED
-            job.error  = str(exc)
+            with job._lock:
+                job.status = JobStatus.FAILED
+                job.error  = str(exc)
             job._append_log(f"Job failed: {exc}")
         finally:
-            job.completed_at = _utcnow()
+            job._close_results()
+            with job._lock:
+                job.completed_at = _utcnow()
+            self._mark_finished(job)
+            self._touch(job)
+
+        # Fire webhook if configured (queued — never blocks job completion)
+        if job.request.webhook_url and job.status == JobStatus.COMPLETED:
+            _fire_webhook(job)
+
+
+def _process_one(job: Job, fp: str, matcher, renamer, artwork_dl, meta_wr, out_root):
+    """Match and rename a single file. Runs on the shared I/O pool.
+
+    Returns ``(basename, RenameResult)``; the result is None if the job was
+    cancelled before this file was started. Paths are handled as plain
+    strings here — this runs once per file, so no Path objects.
+    """
+    name = os.path.basename(fp)
+    if job._cancelled:
+        return name, None
+    req = job.request
+    try:
+        mi = matcher.match_file(fp, req.data_source, extract_media_info=True)
+        if not mi:
+            job._append_log(f"✗  No match: {name}")
+            return name, RenameResult(original=fp, success=False, dry_run=req.dry_run,
+                                      error="No match found")
+
+        new_name    = renamer.generate_new_name(fp, mi, req.naming_scheme)
+        dest        = os.path.normpath(os.path.join(out_root or os.path.dirname(fp), new_name))
+        dest_parent = os.path.dirname(dest)
+        dest_name   = os.path.basename(dest)
+        if dest_parent not in job._made_dirs:
+            os.makedirs(dest_parent, exist_ok=True)
+            job._made_dirs.add(dest_parent)
+
+        # Files run concurrently, so two sources resolving to the same name
+        # must not both pass the exists() check — reserve the destination.
+        with job._lock:
+            taken = dest in job._claimed
+            job._claimed.add(dest)
+        if (taken or os.path.exists(dest)) and dest != os.path.normpath(fp) and not req.overwrite:
+            job._append_log(f"⚠  Conflict: {dest_name}")
+            return name, RenameResult(original=fp, destination=dest,
+                                      success=False, dry_run=req.dry_run, conflict=True)
+
+        if not req.dry_run:
+            if req.operation == FileOperation.COPY:
+                copy_file(fp, dest)
+            else:
+                move_file(fp, dest)
+
+            if artwork_dl:
+                artwork_dl.download_poster(mi, dest_parent)
+            if meta_wr:
+                meta_wr.write_metadata(dest, mi)
+
+        mode = "DRY-RUN" if req.dry_run else req.operation.value.upper()
+        job._append_log(f"✓  [{mode}] {name} → {dest_name}")
+        return name, RenameResult(
+            original=fp, destination=dest,
+            success=True, dry_run=req.dry_run,
+            match_info=MatchInfo.model_construct(**{k: mi[k] for k in _MATCHINFO_FIELDS & mi.keys()}),
+        )
+
+    except Exception as exc:
+        job._append_log(f"✗  Error: {name} — {exc}")
+        return name, RenameResult(original=fp, success=False,
+                                  dry_run=req.dry_run, error=str(exc))
 
 
 # ── Module-level singleton ────────────────────────────────────────────────────
-queue = JobQueue()
+# MR_JOB_RUNNER=external: this process only enqueues; worker.py runs jobs.
+queue = JobQueue(get_store(), run_jobs=os.getenv("MR_JOB_RUNNER", "inline") != "external")
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-MEDIA_EXTENSIONS = {".mp4", ".mkv", ".avi", ".mov", ".m4v", ".mpg", ".mpeg", ".flv", ".wmv"}
 
-def _expand_paths(paths: List[str]) -> List[str]:
-    """Expand directories to lists of media files."""
-    result = []
+def _iter_media_files(paths: List[str]) -> Iterator[str]:
+    """Yield media files from *paths*, expanding directories as they are scanned.
+
+    Plain files are yielded as given. Directories are walked concurrently on
+    _scan_pool, so order follows discovery (each directory's own files are
+    sorted). Closing the generator early stops the walk.
+    """
     for p in paths:
-        path = Path(p)
-        if path.is_dir():
-            result.extend(str(f) for f in sorted(path.rglob("*"))
-                          if f.is_file() and f.suffix.lower() in MEDIA_EXTENSIONS)
-        elif path.is_file():
-            result.append(str(path))
-    return result
+        if os.path.isdir(p):
+            yield from _scan_media(p)
+        elif os.path.isfile(p):
+            yield str(Path(p))
+
+
+def _scan_media(root: str) -> Iterator[str]:
+    """Concurrent os.scandir walk of *root*; filters on extension before stat."""
+    found: "Queue[Optional[List[str]]]" = Queue(maxsize=256)   # per-directory batches
+    stop    = threading.Event()
+    lock    = threading.Lock()
+    pending = 1   # directories submitted but not yet listed
+
+    def put(item) -> None:
+        while not stop.is_set():
+            try:
+                found.put(item, timeout=0.5)
+                return
+            except Full:
+                pass
+
+    def scan_dir(d: str) -> None:
+        nonlocal pending
+        files: List[str] = []
+        subdirs: List[str] = []
+        if not stop.is_set():
+            try:
+                with os.scandir(d) as it:
+                    for e in it:
+                        if e.is_dir(follow_symlinks=False):
+                            if not skip_dir(e.name):
+                                subdirs.append(e.path)
+                            continue
+                        if is_media(e.name) and e.is_file():
+                            files.append(e.path)
+            except OSError:
+                pass
+        with lock:
+            pending += len(subdirs)
+        for sub in subdirs:
+            _scan_pool.submit(scan_dir, sub)
+        if files:
+            files.sort()
+            put(files)
+        with lock:
+            pending -= 1
+            last = pending == 0
+        if last:
+            put(None)
+
+    _scan_pool.submit(scan_dir, root)
+    try:
+        while (batch := found.get()) is not None:
+            yield from batch
+    finally:
+        stop.set()
+
+
+# Completed jobs' webhooks are queued and sent by one background thread over
+# the shared keep-alive session, so a burst of finishing jobs neither blocks
+# on the network nor opens a connection each.
+_webhook_q: "Queue[tuple]" = Queue(maxsize=1000)
 
 
 def _fire_webhook(job: Job):
+    payload = job.to_summary().model_dump(mode="json")
     try:
-        payload = job.to_summary().model_dump(mode="json")
-        _requests.post(job.request.webhook_url, json=payload, timeout=10)
-    except Exception as exc:
-        job._append_log(f"Webhook failed: {exc}")
+        _webhook_q.put_nowait((job, job.request.webhook_url, payload))
+    except Full:
+        job._append_log("Webhook dropped — too many pending webhooks")
+
+
+def _webhook_worker():
+    while True:
+        batch = [_webhook_q.get()]
+        try:
+            while len(batch) < 50:
+                batch.append(_webhook_q.get(timeout=0.25))
+        except Empty:
+            pass
+        for job, url, payload in batch:
+            try:
+                _session.post(url, json=payload, timeout=10)
+            except Exception as exc:
+                job._append_log(f"Webhook failed: {exc}")
+
+
+threading.Thread(target=_webhook_worker, daemon=True, name="mr-webhooks").start()
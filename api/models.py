@@ -188,8 +188,8 @@ class JobSummary(BaseModel):
 
 class JobDetail(JobSummary):
     request:        JobRequest
-    results:        List[RenameResult]   = []
-    log:            List[str]            = []
+    results:        List[RenameResult]   = Field([], description="Most recent 200 results — all of them via /jobs/{job_id}/results")
+    log:            List[str]            = Field([], description="Most recent 200 log lines")
 
 
 # ── Search models ─────────────────────────────────────────────────────────────
@@ -262,6 +262,10 @@ class ScanRequest(BaseModel):
         default=[".mp4", ".mkv", ".avi", ".mov", ".m4v", ".mpg", ".mpeg", ".flv", ".wmv"],
         description="File extensions to include"
     )
+    exclude_dirs:   List[str]            = Field(
+        default=[],
+        description="Directory names to skip, on top of hidden and system/cache folders"
+    )
 
 class ScanResponse(BaseModel):
     directory:      str
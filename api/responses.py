@@ -0,0 +1,47 @@
+"""
+orjson-backed JSON response, used as the app's default response class.
+
+FastAPI's bundled ``ORJSONResponse`` is deprecated in newer releases, so the
+few lines it needs live here instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def etag_response(request: Request, content: Any) -> Response:
+    """*content* as JSON with an ETag of its body; 304 if the client has it.
+
+    The tag is a hash of the encoded body, so it is the same from every
+    worker process and changes exactly when the data does.
+    """
+    resp = ORJSONResponse(content, headers={"Cache-Control": "private, no-cache"})
+    etag = '"%s"' % hashlib.blake2b(resp.body, digest_size=8).hexdigest()
+    resp.headers["ETag"] = etag
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag,
+                                                  "Cache-Control": "private, no-cache"})
+    return resp
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    tags = set()
+    for tag in header.split(","):
+        tag = tag.strip()
+        tags.add(tag[2:] if tag.startswith("W/") else tag)   # no str.removeprefix on 3.8
+    return "*" in tags or etag in tags
@@ -5,9 +5,11 @@
 from __future__ import annotations
 from typing import List
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse, Response
 
 from ..models import JobRequest, JobSummary, JobDetail
 from ..jobs import queue
+from ..responses import ORJSONResponse
 
 router = APIRouter(prefix="/jobs", tags=["Batch Jobs"])
 
@@ -33,7 +35,8 @@ def create_job(req: JobRequest):
 @router.get("", response_model=List[JobSummary], summary="List all jobs")
 def list_jobs():
     """Return all jobs (most recent first)."""
-    return [j.to_summary() for j in queue.list_all()]
+    # Summaries are cached per job, so skip re-validating them on every poll.
+    return ORJSONResponse(content=[j.to_summary_dict() for j in queue.list_all()])
 
 
 @router.get("/{job_id}", response_model=JobDetail, summary="Get job detail + log")
@@ -42,7 +45,23 @@ def get_job(job_id: str):
     job = queue.get(job_id)
     if not job:
         raise HTTPException(404, f"Job not found: {job_id}")
-    return job.to_detail()
+    # Already JSON-ready — skip response_model validation of every result.
+    return ORJSONResponse(content=job.to_detail_dict())
+
+
+@router.get("/{job_id}/results", summary="Stream every per-file result (NDJSON)")
+def get_job_results(job_id: str):
+    """
+    All per-file results of a job as newline-delimited JSON, one `RenameResult`
+    per line. `GET /jobs/{job_id}` only includes the most recent 200.
+    """
+    job = queue.get(job_id)
+    if not job:
+        raise HTTPException(404, f"Job not found: {job_id}")
+    job.flush_results()
+    if not job.results_path.exists():
+        return Response(b"", media_type="application/x-ndjson")
+    return FileResponse(job.results_path, media_type="application/x-ndjson")
 
 
 @router.post("/{job_id}/cancel", response_model=JobSummary, summary="Cancel a running job")
@@ -4,7 +4,9 @@
 """
 
 from __future__ import annotations
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from ..deps import get_pm, get_hist
+from ..responses import etag_response
 from ..models import (
     PresetsResponse, PresetEntry, PresetCreateRequest,
     HistoryResponse, HistoryEntry,
@@ -14,32 +16,22 @@ presets_router  = APIRouter(prefix="/presets",  tags=["Presets"])
 history_router  = APIRouter(prefix="/history",  tags=["History"])
 
 
-def _pm():
-    from core.presets import PresetManager
-    return PresetManager()
-
-def _hist():
-    from core.history import RenameHistory
-    return RenameHistory()
-
-
 # ── Presets ───────────────────────────────────────────────────────────────────
 
 @presets_router.get("", response_model=PresetsResponse, summary="List all naming presets")
-def list_presets():
-    pm = _pm()
-    return PresetsResponse(presets=[PresetEntry(name=n, scheme=s) for n, s in pm.presets.items()])
+def list_presets(request: Request, pm=Depends(get_pm)):
+    resp = PresetsResponse(presets=[PresetEntry(name=n, scheme=s) for n, s in pm.presets.items()])
+    return etag_response(request, resp.model_dump())
 
 
 @presets_router.post("", response_model=PresetEntry, status_code=201, summary="Create or update a preset")
-def create_preset(req: PresetCreateRequest):
-    pm = _pm(); pm.save_preset(req.name, req.scheme)
+def create_preset(req: PresetCreateRequest, pm=Depends(get_pm)):
+    pm.save_preset(req.name, req.scheme)
     return PresetEntry(name=req.name, scheme=req.scheme)
 
 
 @presets_router.delete("/{name}", status_code=204, summary="Delete a preset")
-def delete_preset(name: str):
-    pm = _pm()
+def delete_preset(name: str, pm=Depends(get_pm)):
     if name not in pm.presets:
         raise HTTPException(404, f"Preset not found: {name}")
     pm.delete_preset(name)
@@ -48,8 +40,8 @@ def delete_preset(name: str):
 # ── History ───────────────────────────────────────────────────────────────────
 
 @history_router.get("", response_model=HistoryResponse, summary="Get rename history")
-def get_history(limit: int = 50):
-    h = _hist()
+def get_history(request: Request, limit: int = 50, h=Depends(get_hist)):
     entries = [HistoryEntry(**op) for op in h.get_last_operations(limit)]
-    return HistoryResponse(entries=entries, total=len(h.history),
+    resp = HistoryResponse(entries=entries, total=len(h.history),
                            can_undo=h.can_undo(), can_redo=h.can_redo())
+    return etag_response(request, resp.model_dump())
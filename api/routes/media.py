@@ -3,12 +3,19 @@
 """
 
 from __future__ import annotations
-import os, hashlib, time
+import os, stat, time, asyncio, threading, multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Callable, Iterable, List, Optional, TypeVar
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from core.renamer import copy_file, move_file
+from core.scanner import MEDIA_EXTENSIONS, is_media, iter_media, normalize_extensions
+from starlette.concurrency import run_in_threadpool
 
+from ..deps import get_matcher
 from ..models import (
     MatchRequest, MatchResponse, FileMatchResult, MatchInfo,
     RenameRequest, RenameResponse, RenameResult,
@@ -20,12 +27,46 @@ from ..models import (
 
 router = APIRouter(prefix="/media", tags=["Media"])
 
-MEDIA_EXTS = {".mp4",".mkv",".avi",".mov",".m4v",".mpg",".mpeg",".flv",".wmv"}
+MEDIA_EXTS = MEDIA_EXTENSIONS   # dot-less, lower-case
 
+# Per-request cap on files worked on at once by the async endpoints below.
+FILE_CONCURRENCY = 8
 
-def _get_matcher():
-    from core.matcher import MediaMatcher
-    return MediaMatcher()
+_MATCHINFO_FIELDS = frozenset(MatchInfo.model_fields)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def _map_threaded(fn: Callable[[T], R], items: Iterable[T]) -> List[R]:
+    """Run blocking ``fn`` over *items* in the threadpool, FILE_CONCURRENCY at
+    a time, keeping the event loop free. Results keep the order of *items*."""
+    sem = asyncio.BoundedSemaphore(FILE_CONCURRENCY)
+
+    async def one(item: T) -> R:
+        async with sem:
+            return await run_in_threadpool(fn, item)
+
+    return await asyncio.gather(*(one(i) for i in items))
+
+
+def _check_input(fp: str) -> Optional[str]:
+    """Why *fp* can't be matched, or None. The suffix test runs first, so
+    non-media inputs cost no syscall; the rest cost a single stat."""
+    if not is_media(fp):
+        return "Not a media file"
+    try:
+        st = os.stat(fp)
+    except OSError:
+        return "File not found"
+    if not stat.S_ISREG(st.st_mode):
+        return "Not a media file"
+    return None
+
+
+def _match_info(mi: dict) -> MatchInfo:
+    # The matcher already returns MatchInfo's types, so skip re-validation
+    return MatchInfo.model_construct(**{k: mi[k] for k in _MATCHINFO_FIELDS & mi.keys()})
 
 def _get_renamer(scheme: str):
     from core.renamer import FileRenamer
@@ -35,25 +76,37 @@ def _get_renamer(scheme: str):
 # ── Scan ──────────────────────────────────────────────────────────────────────
 
 @router.post("/scan", response_model=ScanResponse, summary="Scan directory for media files")
-def scan_directory(req: ScanRequest):
+async def scan_directory(req: ScanRequest):
     """Recursively scan a directory and return all matching media files."""
     d = Path(req.directory)
     if not d.exists():
         raise HTTPException(404, f"Directory not found: {req.directory}")
-    exts = {e.lower() if e.startswith(".") else f".{e.lower()}" for e in req.extensions}
-    if req.recursive:
-        files = sorted(str(f) for f in d.rglob("*") if f.is_file() and f.suffix.lower() in exts)
-    else:
-        files = sorted(str(f) for f in d.iterdir() if f.is_file() and f.suffix.lower() in exts)
+    exts  = normalize_extensions(req.extensions)
+    files = await run_in_threadpool(lambda: sorted(iter_media(str(d), exts, req.recursive, req.exclude_dirs)))
     return ScanResponse(directory=str(d), files=files, count=len(files))
 
 
+@router.post("/scan/stream", summary="Scan directory, streaming files as NDJSON")
+def scan_directory_stream(req: ScanRequest):
+    """
+    Like `/media/scan`, but each file is sent as soon as it is found — one
+    `{"file": "..."}` object per line, **unsorted** — so large trees start
+    arriving immediately and are never held in memory as a whole.
+    """
+    d = Path(req.directory)
+    if not d.exists():
+        raise HTTPException(404, f"Directory not found: {req.directory}")
+    exts = normalize_extensions(req.extensions)
+    lines = (orjson.dumps({"file": fp}) + b"\n"
+             for fp in iter_media(str(d), exts, req.recursive, req.exclude_dirs))
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
 # ── Parse ─────────────────────────────────────────────────────────────────────
 
 @router.post("/parse", response_model=ParseResponse, summary="Parse filename into structured metadata")
-def parse_filename(req: ParseRequest):
+def parse_filename(req: ParseRequest, matcher=Depends(get_matcher)):
     """Extract title, year, season, episode from a filename without any API calls."""
-    matcher = _get_matcher()
     info = matcher._parse_filename(req.filename)
     return ParseResponse(
         filename=req.filename,
@@ -68,9 +121,8 @@ def parse_filename(req: ParseRequest):
 # ── Search ────────────────────────────────────────────────────────────────────
 
 @router.post("/search", response_model=SearchResponse, summary="Search TMDB for movies or TV shows")
-def search(req: SearchRequest):
+def search(req: SearchRequest, matcher=Depends(get_matcher)):
     """Search TheMovieDB for matching titles. Useful for manual match correction."""
-    matcher = _get_matcher()
     results: List[SearchResult] = []
     if req.type in (None, "movie"):
         for r in matcher.search_movies(req.query, req.year):
@@ -82,38 +134,40 @@ def search(req: SearchRequest):
             results.append(SearchResult(title=r["title"] or "", year=r.get("year"),
                                         type="tv", tmdb_id=r.get("tmdb_id"),
                                         overview=r.get("overview")))
+    # TMDB can repeat an item across result pages; keep its first occurrence
+    seen: set = set()
+    results = [r for r in results
+               if r.tmdb_id is None
+               or ((r.type, r.tmdb_id) not in seen and not seen.add((r.type, r.tmdb_id)))]
     return SearchResponse(results=results, query=req.query, total=len(results))
 
 
 # ── Match ─────────────────────────────────────────────────────────────────────
 
 @router.post("/match", response_model=MatchResponse, summary="Match files against TMDB/TVDB")
-def match_files(req: MatchRequest):
+async def match_files(req: MatchRequest, matcher=Depends(get_matcher)):
     """
     Match a list of media files against an online database and return proposed new names.
     This is a **synchronous** call — for large batches use /jobs instead.
     """
     t0 = time.monotonic()
-    matcher = _get_matcher()
     renamer = _get_renamer(req.naming_scheme)
-    results: List[FileMatchResult] = []
 
-    for fp in req.files:
-        if not Path(fp).exists():
-            results.append(FileMatchResult(file=fp, matched=False, error=f"File not found: {fp}"))
-            continue
+    def match_one(fp: str) -> FileMatchResult:
+        err = _check_input(fp)
+        if err:
+            return FileMatchResult(file=fp, matched=False, error=f"{err}: {fp}")
         try:
             mi = matcher.match_file(fp, req.data_source, req.extract_media_info)
-            if mi:
-                new_name = renamer.generate_new_name(fp, mi, req.naming_scheme)
-                results.append(FileMatchResult(
-                    file=fp, matched=True, new_name=new_name,
-                    match_info=MatchInfo(**{k: v for k, v in mi.items() if k in MatchInfo.model_fields}),
-                ))
-            else:
-                results.append(FileMatchResult(file=fp, matched=False, error="No match found"))
+            if not mi:
+                return FileMatchResult(file=fp, matched=False, error="No match found")
+            new_name = renamer.generate_new_name(fp, mi, req.naming_scheme)
+            return FileMatchResult(file=fp, matched=True, new_name=new_name,
+                                   match_info=_match_info(mi))
         except Exception as exc:
-            results.append(FileMatchResult(file=fp, matched=False, error=str(exc)))
+            return FileMatchResult(file=fp, matched=False, error=str(exc))
+
+    results: List[FileMatchResult] = await _map_threaded(match_one, req.files)
 
     matched = sum(1 for r in results if r.matched)
     return MatchResponse(
@@ -124,64 +178,72 @@ def match_files(req: MatchRequest):
 
 # ── Rename ────────────────────────────────────────────────────────────────────
 
-import shutil
-
 @router.post("/rename", response_model=RenameResponse, summary="Match and rename files (synchronous)")
-def rename_files(req: RenameRequest):
+async def rename_files(req: RenameRequest, matcher=Depends(get_matcher)):
     """
     Match and rename files in one step.
     For large batches prefer *POST /jobs* which runs asynchronously.
     """
     t0 = time.monotonic()
-    matcher = _get_matcher()
     renamer = _get_renamer(req.naming_scheme)
-    results: List[RenameResult] = []
-    renamed = skipped = conflicts = 0
 
-    for fp in req.files:
+    # Pass 1 (parallel, network-bound): match each file and work out its
+    # destination. Returns a finished RenameResult if the file drops out.
+    def plan_one(fp: str):
+        err = _check_input(fp)
+        if err:
+            return RenameResult(original=fp, success=False, dry_run=req.dry_run, error=err)
         p = Path(fp)
-        if not p.exists():
-            results.append(RenameResult(original=fp, success=False, dry_run=req.dry_run,
-                                        error="File not found"))
-            skipped += 1
-            continue
         try:
             mi = matcher.match_file(fp, req.data_source)
             if not mi:
-                results.append(RenameResult(original=fp, success=False, dry_run=req.dry_run,
-                                            error="No match found"))
-                skipped += 1
-                continue
-
+                return RenameResult(original=fp, success=False, dry_run=req.dry_run,
+                                    error="No match found")
             new_name  = renamer.generate_new_name(fp, mi, req.naming_scheme)
             dest_base = Path(req.output_dir) if req.output_dir else p.parent
-            dest      = dest_base / new_name
-            dest.parent.mkdir(parents=True, exist_ok=True)
-
-            if dest.exists() and dest != p and not req.overwrite:
-                results.append(RenameResult(original=fp, destination=str(dest),
-                                            success=False, dry_run=req.dry_run, conflict=True))
-                conflicts += 1
-                continue
-
-            if not req.dry_run:
-                if req.operation == "copy":
-                    shutil.copy2(fp, str(dest))
-                else:
-                    shutil.move(fp, str(dest))
-
-            results.append(RenameResult(
-                original=fp, destination=str(dest), success=True, dry_run=req.dry_run,
-                match_info=MatchInfo(**{k: v for k, v in mi.items() if k in MatchInfo.model_fields}),
-            ))
-            renamed += 1
-
+            return fp, p, dest_base / new_name, mi
         except Exception as exc:
-            results.append(RenameResult(original=fp, success=False, dry_run=req.dry_run, error=str(exc)))
-            skipped += 1
-
+            return RenameResult(original=fp, success=False, dry_run=req.dry_run, error=str(exc))
+
+    # Pass 2 (serial, filesystem-bound): conflict checks and moves in input
+    # order, so one request doesn't have several moves contending for a disk.
+    def apply_all(planned) -> List[RenameResult]:
+        results: List[RenameResult] = []
+        claimed: set = set()   # destinations taken by earlier files of this request
+        for item in planned:
+            if isinstance(item, RenameResult):
+                results.append(item)
+                continue
+            fp, p, dest, mi = item
+            try:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                taken = dest in claimed
+                claimed.add(dest)
+                if (taken or dest.exists()) and dest != p and not req.overwrite:
+                    results.append(RenameResult(original=fp, destination=str(dest),
+                                                success=False, dry_run=req.dry_run, conflict=True))
+                    continue
+
+                if not req.dry_run:
+                    if req.operation == "copy":
+                        copy_file(fp, str(dest))
+                    else:
+                        move_file(fp, str(dest))
+
+                results.append(RenameResult(original=fp, destination=str(dest), success=True,
+                                            dry_run=req.dry_run, match_info=_match_info(mi)))
+            except Exception as exc:
+                results.append(RenameResult(original=fp, success=False,
+                                            dry_run=req.dry_run, error=str(exc)))
+        return results
+
+    planned = await _map_threaded(plan_one, req.files)
+    results = await run_in_threadpool(apply_all, planned)
+
+    renamed   = sum(1 for r in results if r.success)
+    conflicts = sum(1 for r in results if r.conflict)
     return RenameResponse(
-        results=results, renamed_count=renamed, skipped_count=skipped,
+        results=results, renamed_count=renamed, skipped_count=len(results) - renamed - conflicts,
         conflict_count=conflicts, total=len(results), dry_run=req.dry_run,
         duration_ms=round((time.monotonic() - t0) * 1000, 1),
     )
@@ -191,34 +253,39 @@ def rename_files(req: RenameRequest):
 
 @router.post("/checksum", response_model=ChecksumResponse,
              summary="Generate checksums (MD5/SHA1/SHA256) for files")
-def generate_checksums(req: ChecksumRequest):
+async def generate_checksums(req: ChecksumRequest):
     """
     Compute file checksums. Optionally write an SFV/MD5/SHA256 sidecar file
     alongside each media file — useful for verifying archive integrity.
     """
-    alg = req.algorithm.value
-    results: List[ChecksumResult] = []
+    from core.checksum import hash_file
+    alg  = req.algorithm.value
+    loop = asyncio.get_running_loop()
+    pool = _hash_pool()
+    results = await asyncio.gather(*(
+        loop.run_in_executor(pool, hash_file, fp, alg, req.save_sfv) for fp in req.files
+    ))
+    return ChecksumResponse(
+        results=[ChecksumResult(file=fp, algorithm=req.algorithm, checksum=checksum,
+                                sfv_file=sfv_file, error=error)
+                 for fp, checksum, sfv_file, error in results],
+        algorithm=req.algorithm,
+    )
+
+
+_hash_pool_lock = threading.Lock()
+_hash_pool_inst: ProcessPoolExecutor | None = None
 
-    for fp in req.files:
-        p = Path(fp)
-        if not p.exists():
-            results.append(ChecksumResult(file=fp, algorithm=req.algorithm, error="File not found"))
-            continue
-        try:
-            h = hashlib.new(alg)
-            with open(fp, "rb") as fh:
-                for chunk in iter(lambda: fh.read(65536), b""):
-                    h.update(chunk)
-            checksum = h.hexdigest()
-            sfv_file = None
-            if req.save_sfv:
-                ext_map = {"md5": ".md5", "sha1": ".sha1", "sha256": ".sha256"}
-                sfv_path = p.with_suffix(ext_map.get(alg, f".{alg}"))
-                sfv_path.write_text(f"{checksum}  {p.name}\n")
-                sfv_file = str(sfv_path)
-            results.append(ChecksumResult(file=fp, checksum=checksum,
-                                          algorithm=req.algorithm, sfv_file=sfv_file))
-        except Exception as exc:
-            results.append(ChecksumResult(file=fp, algorithm=req.algorithm, error=str(exc)))
 
-    return ChecksumResponse(results=results, algorithm=req.algorithm)
+def _hash_pool() -> ProcessPoolExecutor:
+    """Hashing is CPU-bound, so it runs on one process per core. Created on
+    first use with the spawn start method — forking the threaded API server
+    could copy held locks into the children."""
+    global _hash_pool_inst
+    with _hash_pool_lock:
+        if _hash_pool_inst is None:
+            _hash_pool_inst = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _hash_pool_inst
@@ -0,0 +1,139 @@
+"""
+Pluggable persistence for batch-job snapshots.
+
+The backend is chosen with the ``MR_STORE`` environment variable:
+
+    unset          → JSON file at ~/.mediarenamer/jobs.json
+    /some/path     → JSON file at that path
+    redis://...    → Redis, one key per job — lets several API workers
+                     (uvicorn --workers N) see each other's jobs
+
+Snapshots are ``JobDetail`` dicts (``model_dump(mode="json")``) encoded
+with orjson.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import orjson
+
+JOBS_FILE = Path.home() / ".mediarenamer" / "jobs.json"
+
+
+class JobStore:
+    """Base store: keeps nothing (pure in-memory queue)."""
+
+    shared = False   # True if other processes read/write the same jobs
+
+    def load_all(self) -> List[dict]:
+        return []
+
+    def load(self, job_id: str) -> Optional[dict]:
+        return None
+
+    def save_all(self, snapshots: List[dict]):
+        pass
+
+    def delete(self, job_id: str):
+        pass
+
+    # ── Hand-off to external workers (shared stores only) ─────────────────────
+
+    def save(self, snapshot: dict):
+        """Write one job, e.g. to enqueue it for an external worker."""
+        self.save_all([snapshot])
+
+    def claim(self, job_id: str) -> bool:
+        """Atomically take ownership of a pending job; False if already taken."""
+        return True
+
+    def request_cancel(self, job_id: str):
+        pass
+
+    def cancel_requested(self, job_id: str) -> bool:
+        return False
+
+
+class FileStore(JobStore):
+    """All jobs in one JSON file, rewritten atomically on every flush."""
+
+    def __init__(self, path: Path = JOBS_FILE):
+        self.path = Path(path)
+
+    def load_all(self) -> List[dict]:
+        try:
+            return orjson.loads(self.path.read_bytes())
+        except FileNotFoundError:
+            return []
+
+    def save_all(self, snapshots: List[dict]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_bytes(orjson.dumps(snapshots))
+        os.replace(tmp, self.path)
+
+    def __str__(self):
+        return str(self.path)
+
+
+class RedisStore(JobStore):
+    """One ``mr:job:{id}`` key per job, expiring after ``TTL`` seconds."""
+
+    PREFIX        = "mr:job:"
+    CLAIM_PREFIX  = "mr:claim:"
+    CANCEL_PREFIX = "mr:cancel:"
+    TTL    = 7 * 24 * 3600
+    shared = True
+
+    def __init__(self, url: str):
+        try:
+            import redis  # noqa: PLC0415
+        except ImportError as exc:
+            raise RuntimeError(
+                "MR_STORE points at Redis but the 'redis' package is not installed. "
+                "Install with: pip install redis"
+            ) from exc
+        self.url = url
+        self._r  = redis.Redis.from_url(url)
+
+    def load_all(self) -> List[dict]:
+        keys = list(self._r.scan_iter(match=self.PREFIX + "*", count=500))
+        if not keys:
+            return []
+        return [orjson.loads(v) for v in self._r.mget(keys) if v]
+
+    def load(self, job_id: str) -> Optional[dict]:
+        raw = self._r.get(self.PREFIX + job_id)
+        return orjson.loads(raw) if raw else None
+
+    def save_all(self, snapshots: List[dict]):
+        pipe = self._r.pipeline(transaction=False)
+        for snap in snapshots:
+            pipe.setex(self.PREFIX + snap["job_id"], self.TTL, orjson.dumps(snap))
+        pipe.execute()
+
+    def delete(self, job_id: str):
+        self._r.delete(self.PREFIX + job_id)
+
+    def claim(self, job_id: str) -> bool:
+        return bool(self._r.set(self.CLAIM_PREFIX + job_id, b"1", nx=True, ex=self.TTL))
+
+    def request_cancel(self, job_id: str):
+        self._r.setex(self.CANCEL_PREFIX + job_id, self.TTL, b"1")
+
+    def cancel_requested(self, job_id: str) -> bool:
+        return bool(self._r.exists(self.CANCEL_PREFIX + job_id))
+
+    def __str__(self):
+        return self.url
+
+
+def get_store() -> JobStore:
+    """Build the store selected by ``MR_STORE``."""
+    target = os.getenv("MR_STORE", "").strip()
+    if target.startswith(("redis://", "rediss://", "unix://")):
+        return RedisStore(target)
+    return FileStore(Path(target).expanduser() if target else JOBS_FILE)
@@ -93,6 +93,7 @@ PYTHONHOME="${APP_DIR}/usr" "${BUNDLED_PIP}" install \
     fastapi \
     "uvicorn[standard]" \
     pydantic \
+    orjson \
     --quiet
 
 echo "  ✓ Dependencies installed"
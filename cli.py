@@ -15,9 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from core.matcher import MediaMatcher
 from core.renamer import FileRenamer
-
-
-MEDIA_EXTENSIONS = {'.mp4', '.mkv', '.avi', '.mov', '.m4v', '.mpg', '.mpeg', '.flv', '.wmv'}
+from core.scanner import is_media, iter_media
 
 
 def main():
@@ -30,23 +28,17 @@ def main():
                         help="Data source for matching")
     parser.add_argument("--dry-run", action="store_true", help="Only show what would be renamed")
     parser.add_argument("--recursive", "-r", action="store_true", help="Scan input directory recursively")
+    parser.add_argument("--exclude", action="append", default=[], metavar="DIR",
+                        help="Directory name to skip when scanning (repeatable)")
     args = parser.parse_args()
 
     # Collect files
     input_path = Path(args.input)
     if input_path.is_file():
-        files = [str(input_path)] if input_path.suffix.lower() in MEDIA_EXTENSIONS else []
+        files = [str(input_path)] if is_media(input_path.name) else []
     else:
-        if args.recursive:
-            files = [
-                str(p) for p in input_path.rglob("*")
-                if p.is_file() and p.suffix.lower() in MEDIA_EXTENSIONS
-            ]
-        else:
-            files = [
-                str(p) for p in input_path.iterdir()
-                if p.is_file() and p.suffix.lower() in MEDIA_EXTENSIONS
-            ]
+        files = list(iter_media(str(input_path), recursive=args.recursive,
+                                exclude_dirs=args.exclude))
 
     if not files:
         print("No media files found.", file=sys.stderr)
@@ -55,8 +47,9 @@ def main():
     matcher = MediaMatcher()
     renamer = FileRenamer(args.scheme)
     matches = []
-    for fp in files:
-        m = matcher.match_file(fp, args.source, extract_media_info=True)
+    for fp, (m, err) in zip(files, matcher.match_files(files, args.source, extract_media_info=True)):
+        if err:
+            raise err
         matches.append(m)
         name = renamer.generate_new_name(fp, m, args.scheme) if m else os.path.basename(fp)
         print(f"  {os.path.basename(fp)} -> {name}")
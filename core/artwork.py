@@ -5,10 +5,18 @@ Artwork downloader — downloads posters and fanart from TMDB.
 import os
 import shutil
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, Iterator, Tuple
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .throttle import AdaptiveLimit
 
 log = logging.getLogger(__name__)
 
@@ -16,6 +24,46 @@ _PLACEHOLDERS = frozenset({
     "", "YOUR_TMDB_API_KEY_HERE", "YOUR_TMDB_API_KEY",
 })
 
+# Most image downloads in flight; each one is a round trip plus a small body,
+# so this many keeps the link busy without exhausting the pool. The number
+# actually running adapts below this (see AdaptiveLimit).
+DOWNLOAD_WORKERS = 16
+
+
+# TMDB details by (endpoint, tmdb_id). Poster and fanart for a title come
+# from the same details document, so the second download reuses the first's.
+_DETAILS_CACHE_SIZE = 512
+_details_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+_details_lock = threading.Lock()
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+# Download concurrency on the shared session, learned across batches
+_shared_limit = AdaptiveLimit(maximum=DOWNLOAD_WORKERS)
+
+
+def _shared_session() -> requests.Session:
+    """Keep-alive session shared by every downloader in the process, so
+    successive details/image requests reuse pooled TLS connections.
+    Transient gateway errors on GETs are retried with backoff."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers.update({"User-Agent": "MediaRenamer/1.0",
+                                     "Accept-Encoding": "gzip, deflate"})
+            adapter = HTTPAdapter(
+                pool_connections=8, pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.3,
+                                  status_forcelist=(502, 503, 504),
+                                  allowed_methods=frozenset({"GET"})),
+            )
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+            _session.hooks["response"].append(_shared_limit.observe)
+        return _session
+
 
 def _read_tmdb_key() -> str:
     """Read TMDB key from env at call-time (never cached at import-time)."""
@@ -32,12 +80,14 @@ def _read_tmdb_key() -> str:
 class ArtworkDownloader:
     """Downloads artwork (posters, backdrops) from TMDB."""
 
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.tmdb_api_key  = _read_tmdb_key()
         self.tmdb_base_url = "https://api.themoviedb.org/3"
         self.image_base    = "https://image.tmdb.org/t/p"
-        self.session       = requests.Session()
-        self.session.headers.update({"User-Agent": "MediaRenamer/1.0"})
+        # Callers (e.g. the API job queue) may pass their own pooled session.
+        self.session       = session or _shared_session()
+        # Gate for batch downloads: ``with downloader.limit: download_poster(...)``
+        self.limit         = _shared_limit if session is None else AdaptiveLimit(maximum=DOWNLOAD_WORKERS)
 
     def download_poster(
         self,
@@ -48,6 +98,33 @@ class ArtworkDownloader:
         """Download the primary poster for *match_info* into *output_dir*."""
         return self._download_image(match_info, output_dir, "poster_path", size, "poster")
 
+    def download_posters(
+        self,
+        jobs: Iterable[Tuple[Dict, str]],
+        size: str = "w500",
+        workers: int = DOWNLOAD_WORKERS,
+    ) -> Iterator[Tuple[Tuple[Dict, str], Optional[str]]]:
+        """download_poster() for many ``(match_info, output_dir)`` jobs,
+        yielding ``(job, poster_path)`` in completion order.
+
+        Details lookups and image downloads for different titles overlap on
+        the shared connection pool instead of running one after another; how
+        many run at once (up to *workers*) is set by ``self.limit``.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return
+
+        def download(mi: Dict, out: str) -> Optional[str]:
+            with self.limit:
+                return self.download_poster(mi, out, size)
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(jobs)),
+                                thread_name_prefix="mr-artwork") as pool:
+            futures = {pool.submit(download, mi, out): (mi, out) for mi, out in jobs}
+            for fut in as_completed(futures):
+                yield futures[fut], fut.result()
+
     def download_fanart(
         self,
         match_info: Dict,
@@ -57,6 +134,31 @@ class ArtworkDownloader:
         """Download the backdrop/fanart for *match_info* into *output_dir*."""
         return self._download_image(match_info, output_dir, "backdrop_path", size, "fanart")
 
+    def _get_details(self, endpoint: str, tmdb_id) -> Optional[Dict]:
+        """TMDB movie/tv details, fetched once per title and cached (LRU)."""
+        key = (endpoint, tmdb_id)
+        with _details_lock:
+            details = _details_cache.get(key)
+            if details is not None:
+                _details_cache.move_to_end(key)
+                return details
+
+        resp = self.session.get(
+            f"{self.tmdb_base_url}/{endpoint}/{tmdb_id}",
+            params={"api_key": self.tmdb_api_key},
+            timeout=10,
+        )
+        if not resp.ok:
+            log.warning("TMDB %s details returned %s", endpoint, resp.status_code)
+            return None
+        details = orjson.loads(resp.content)
+
+        with _details_lock:
+            _details_cache[key] = details
+            if len(_details_cache) > _DETAILS_CACHE_SIZE:
+                _details_cache.popitem(last=False)
+        return details
+
     def _download_image(
         self,
         match_info: Dict,
@@ -73,34 +175,30 @@ class ArtworkDownloader:
 
         try:
             media_type = match_info.get("type", "movie")
-            tmdb_id    = match_info["tmdb_id"]
             endpoint   = "movie" if media_type == "movie" else "tv"
-
-            resp = self.session.get(
-                f"{self.tmdb_base_url}/{endpoint}/{tmdb_id}",
-                params={"api_key": self.tmdb_api_key},
-                timeout=10,
-            )
-            if not resp.ok:
-                log.warning("TMDB %s details returned %s", endpoint, resp.status_code)
+            details    = self._get_details(endpoint, match_info["tmdb_id"])
+            if details is None:
                 return None
 
-            image_path = resp.json().get(image_key)
+            image_path = details.get(image_key)
             if not image_path:
                 return None
 
-            img_url  = f"{self.image_base}/{size}{image_path}"
-            img_resp = self.session.get(img_url, timeout=30, stream=True)
-            if not img_resp.ok:
-                return None
-
-            title    = match_info.get("title", "Unknown").replace("/", "-")
-            filename = f"{title}_{suffix}.jpg"
-            filepath = os.path.join(output_dir, filename)
-            os.makedirs(output_dir, exist_ok=True)
-
-            with open(filepath, "wb") as fh:
-                shutil.copyfileobj(img_resp.raw, fh)
+            img_url = f"{self.image_base}/{size}{image_path}"
+            # Closing the streamed response hands its connection back to the pool
+            with self.session.get(img_url, timeout=30, stream=True) as img_resp:
+                if not img_resp.ok:
+                    return None
+
+                title    = match_info.get("title", "Unknown").replace("/", "-")
+                filename = f"{title}_{suffix}.jpg"
+                filepath = os.path.join(output_dir, filename)
+                os.makedirs(output_dir, exist_ok=True)
+
+                # Unbuffered file: each decoded chunk is one write(2)
+                img_resp.raw.decode_content = True
+                with open(filepath, "wb", buffering=0) as fh:
+                    shutil.copyfileobj(img_resp.raw, fh, 1 << 16)
 
             log.info("Downloaded %s → %s", suffix, filepath)
             return filepath
@@ -0,0 +1,68 @@
+"""
+File checksums (MD5/SHA1/SHA256) with optional sidecar files.
+
+Kept free of heavy imports: hash_file runs in worker processes, which only
+need to import this module.
+"""
+
+import hashlib
+import mmap
+import os
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
+
+READ_SIZE  = 1 << 20   # 1 MiB per read keeps the Python-level loop short
+MMAP_LIMIT = (1 << 31) if sys.maxsize <= 2**32 else (1 << 62)   # < 2 GiB on 32-bit builds
+
+SIDECAR_EXT = {"md5": ".md5", "sha1": ".sha1", "sha256": ".sha256"}
+
+
+def hash_file(fp: str, alg: str, save_sidecar: bool = False
+              ) -> Tuple[str, Optional[str], Optional[str], Optional[str]]:
+    """Hash one file; returns ``(file, checksum, sidecar_file, error)``."""
+    p = Path(fp)
+    if not p.exists():
+        return fp, None, None, "File not found"
+    try:
+        with open(fp, "rb") as fh:
+            h = _digest(fh, alg)
+        checksum = h.hexdigest()
+        sidecar  = None
+        if save_sidecar:
+            sidecar = str(p.with_suffix(SIDECAR_EXT.get(alg, f".{alg}")))
+            _write_bytes(sidecar, f"{checksum}  {p.name}\n".encode())
+        return fp, checksum, sidecar, None
+    except Exception as exc:
+        return fp, None, None, str(exc)
+
+
+def _write_bytes(path: str, payload: bytes) -> None:
+    """Write a small file with raw os calls — no buffered/text wrapper."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _digest(fh, alg: str):
+    """Hash an open binary file with the read/update loop kept in C."""
+    if hasattr(os, "posix_fadvise"):
+        # One front-to-back pass: let the kernel read ahead aggressively
+        os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    if hasattr(hashlib, "file_digest"):   # Python 3.11+
+        return hashlib.file_digest(fh, alg)
+    h    = hashlib.new(alg)
+    size = os.fstat(fh.fileno()).st_size
+    if 0 < size < MMAP_LIMIT:
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):    # Python 3.8+, not on Windows
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            h.update(mm)
+        return h
+    for chunk in iter(lambda: fh.read(READ_SIZE), b""):
+        h.update(chunk)
+    return h
@@ -1,50 +1,124 @@
 """
 Rename history manager - tracks rename operations for undo/redo
+
+History is stored as JSON Lines (one operation per line) so recording a
+rename appends a single line instead of rewriting the whole file. The undo
+position lives in a small sidecar file next to it.
 """
 
-import json
 import os
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Deque, List, Dict, Optional, Tuple
 from datetime import datetime
 
+import orjson
+
 
 class RenameHistory:
     """Manages rename history for undo/redo operations"""
-    
+
+    MAX_ENTRIES = 100      # operations kept for undo/redo
+    COMPACT_AT  = 10       # rewrite the file once it holds this many × MAX_ENTRIES lines
+
     def __init__(self, history_file: str = None):
         self.history_file = history_file or os.path.join(
-            os.path.expanduser("~"), ".mediarenamer", "history.json"
+            os.path.expanduser("~"), ".mediarenamer", "history.jsonl"
         )
-        self.history: List[Dict] = []
-        self.current_index = -1
+        # Undo position: how many of the newest operations are currently undone
+        self.index_file = os.path.splitext(self.history_file)[0] + ".index"
+        self.history: Deque[Dict] = deque(maxlen=self.MAX_ENTRIES)  # applied, oldest first
+        self._redo:   Deque[Dict] = deque(maxlen=self.MAX_ENTRIES)  # undone, next redo last
+        self._lines = 0        # lines in history_file, including ones beyond MAX_ENTRIES
+        self._mtime: Optional[Tuple] = None  # (history, index) mtimes at last load/save
         self._ensure_history_dir()
+        self._migrate_json()
         self._load_history()
-    
+
     def _ensure_history_dir(self):
         """Ensure history directory exists"""
         history_dir = os.path.dirname(self.history_file)
         os.makedirs(history_dir, exist_ok=True)
-    
+
+    def _migrate_json(self):
+        """Convert a history.json written by older versions to JSON Lines"""
+        legacy = os.path.splitext(self.history_file)[0] + ".json"
+        if legacy == self.history_file or os.path.exists(self.history_file) \
+                or not os.path.exists(legacy):
+            return
+        try:
+            with open(legacy, 'rb') as f:
+                self.history.extend(orjson.loads(f.read()))
+            self._rewrite()
+            os.remove(legacy)
+        except Exception as e:
+            print(f"Error migrating history: {e}")
+
+    def _file_mtime(self) -> Optional[Tuple]:
+        mtimes = []
+        for path in (self.history_file, self.index_file):
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes) if mtimes[0] is not None else None
+
+    def reload_if_changed(self):
+        """Re-read the history files if another process wrote them since we last did"""
+        if self._file_mtime() != self._mtime:
+            self._load_history()
+
     def _load_history(self):
         """Load history from file"""
-        if os.path.exists(self.history_file):
-            try:
-                with open(self.history_file, 'r') as f:
-                    self.history = json.load(f)
-                    self.current_index = len(self.history) - 1
-            except Exception:
-                self.history = []
-                self.current_index = -1
-    
-    def _save_history(self):
-        """Save history to file"""
+        self._mtime = self._file_mtime()
+        if self._mtime is None:
+            return
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(self.history, f, indent=2)
+            ops: List[Dict] = []
+            with open(self.history_file, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        ops.append(orjson.loads(line))
+            split = len(ops) - self._read_undone(len(ops))
+            self.history = deque(ops[:split], maxlen=self.MAX_ENTRIES)
+            self._redo   = deque(reversed(ops[split:]), maxlen=self.MAX_ENTRIES)
+            self._lines  = len(ops)
+        except Exception:
+            self.history.clear()
+            self._redo.clear()
+            self._lines = 0
+
+    def _read_undone(self, total: int) -> int:
+        try:
+            undone = int(Path(self.index_file).read_text().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+        return min(max(undone, 0), total)
+
+    def _save_index(self):
+        """Persist the undo position (atomic replace of a one-line file)"""
+        try:
+            tmp = self.index_file + ".tmp"
+            with open(tmp, 'w') as f:
+                f.write(f"{len(self._redo)}\n")
+            os.replace(tmp, self.index_file)
         except Exception as e:
             print(f"Error saving history: {e}")
-    
+        self._mtime = self._file_mtime()
+
+    def _rewrite(self):
+        """Write the in-memory history as a fresh file (compaction)"""
+        try:
+            tmp = self.history_file + ".tmp"
+            with open(tmp, 'wb') as f:
+                f.writelines(orjson.dumps(op) + b"\n" for op in self.history)
+                f.writelines(orjson.dumps(op) + b"\n" for op in reversed(self._redo))
+            os.replace(tmp, self.history_file)
+            self._lines = len(self.history) + len(self._redo)
+        except Exception as e:
+            print(f"Error saving history: {e}")
+        self._save_index()
+
     def add_operation(self, original_path: str, new_path: str, match_info: Dict = None):
         """Add a rename operation to history"""
         operation = {
@@ -53,50 +127,53 @@ class RenameHistory:
             'new_path': new_path,
             'match_info': match_info or {}
         }
-        
-        # Remove any operations after current index (when undoing)
-        if self.current_index < len(self.history) - 1:
-            self.history = self.history[:self.current_index + 1]
-        
+
+        # A new operation discards anything that was undone; the deque drops
+        # the oldest entry itself once MAX_ENTRIES is reached
+        truncated = bool(self._redo)
+        self._redo.clear()
         self.history.append(operation)
-        self.current_index = len(self.history) - 1
-        
-        # Keep only last 100 operations
-        if len(self.history) > 100:
-            self.history = self.history[-100:]
-            self.current_index = len(self.history) - 1
-        
-        self._save_history()
-    
+
+        if truncated or self._lines + 1 > self.MAX_ENTRIES * self.COMPACT_AT:
+            self._rewrite()
+            return
+        try:
+            with open(self.history_file, 'ab') as f:
+                f.write(orjson.dumps(operation) + b"\n")
+            self._lines += 1
+        except Exception as e:
+            print(f"Error saving history: {e}")
+        self._mtime = self._file_mtime()
+
     def can_undo(self) -> bool:
         """Check if undo is possible"""
-        return self.current_index >= 0
-    
+        return bool(self.history)
+
     def can_redo(self) -> bool:
         """Check if redo is possible"""
-        return self.current_index < len(self.history) - 1
-    
+        return bool(self._redo)
+
     def undo(self) -> Optional[Dict]:
         """Get the last operation to undo"""
         if not self.can_undo():
             return None
-        
-        operation = self.history[self.current_index]
-        self.current_index -= 1
-        self._save_history()
+
+        operation = self.history.pop()
+        self._redo.append(operation)
+        self._save_index()
         return operation
-    
+
     def redo(self) -> Optional[Dict]:
         """Get the next operation to redo"""
         if not self.can_redo():
             return None
-        
-        self.current_index += 1
-        operation = self.history[self.current_index]
-        self._save_history()
+
+        operation = self._redo.pop()
+        self.history.append(operation)
+        self._save_index()
         return operation
-    
+
     def get_last_operations(self, count: int = 10) -> List[Dict]:
-        """Get last N operations"""
-        start = max(0, len(self.history) - count)
-        return self.history[start:]
+        """Get the last N applied (undoable) operations, oldest first"""
+        count = min(max(count, 0), len(self.history))
+        return [self.history[-i] for i in range(count, 0, -1)]
@@ -4,11 +4,21 @@ Media file matcher — matches files against TMDB / TheTVDB.
 
 import os
 import re
+import time
 import logging
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ── Logging ───────────────────────────────────────────────────────────────────
 # MatchWorker catches exceptions and surfaces them in the UI.
@@ -31,6 +41,276 @@ _PLACEHOLDERS = frozenset({
 })
 
 
+# ── Filename patterns ─────────────────────────────────────────────────────────
+# One compiled union of every naming form, tried in priority order (the first
+# alternative that matches wins). Each form names its groups <form>_t (title),
+# and <form>_s/<form>_e (season/episode) or <form>_y (year); m.lastgroup says
+# which form matched.
+
+def _literal_alternation(words) -> str:
+    """Regex matching any of *words* (case-folded), factored as a prefix trie.
+
+    A flat ``a|b|c`` makes the engine try every tag in turn at each candidate
+    position; nested on shared prefixes, one character picks the only branch
+    that can still match.
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for ch in word.lower():
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: Dict) -> str:
+        alts = [re.escape(ch) + emit(sub) for ch, sub in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 and "" not in node else f"(?:{'|'.join(alts)})"
+        return body + "?" if "" in node else body
+
+    return emit(trie)
+
+
+# "Title.2024.Quality..." — year must be followed by a non-title token
+# so we don't confuse "The.100.Show" with year=100.
+# Require the year to be followed by end-of-string OR a quality/source tag.
+_QUALITY_WORDS = (
+    "BluRay", "Blu-Ray", "BDRip", "BRRip", "WEB-DL", "WEBDL", "WEBRip", "HDTV", "DVDRip",
+    "DVDScr", "HDRip", "AMZN", "NF", "DSNP", "HMAX", "ATVP",
+    "x264", "x265", "h264", "h265", "HEVC", "AVC",
+    "AAC", "AC3", "DTS", "DD5", "TrueHD", "FLAC", "MP3",
+    "REMUX", "PROPER", "REPACK", "EXTENDED", "THEATRICAL",
+)
+# Atomic groups and possessive quantifiers need Python 3.11+. They only cut
+# backtracking — matches are the same without them — so older Pythons get
+# the plain forms.
+_ATOMIC = sys.version_info >= (3, 11)
+
+_QUALITY_TAGS = rf"(?{'>' if _ATOMIC else ':'}{_literal_alternation(_QUALITY_WORDS)}|\d{{3,4}}p|[-\[])"
+
+# A separator run. Possessive: nothing that may follow one (a digit, S, "(",
+# a tag) starts with a separator, so giving characters back can never help —
+# and without it a long run of dots is re-split for every title length.
+_SEP = r"[\.\s_]++" if _ATOMIC else r"[\.\s_]+"
+# The lazy title: one leading separator, or anything ending on a non-separator.
+# A longer title ending inside a run leaves the same tail as one ending where
+# the run starts, so it can't match anything shorter titles didn't; skipping
+# those lengths keeps every form linear in the length of the name.
+_TITLE = r"(?:[^\S\n]|[._]|.*?[^\.\s_])"
+
+_FILENAME_FORMS = (
+    # S01E02 / S01E02E03
+    ("se",    rf"(?P<se_t>{_TITLE}){_SEP}S(?P<se_s>\d{{1,2}})E(?P<se_e>\d{{1,2}})"),
+    # 1x02
+    ("x",     rf"(?P<x_t>{_TITLE}){_SEP}(?P<x_s>\d{{1,2}})x(?P<x_e>\d{{1,2}})"),
+    # "(2024)" with parentheses — very reliable
+    ("paren", rf"(?P<paren_t>{_TITLE}){_SEP}\((?P<paren_y>\d{{4}})\)"),
+    ("qual",  rf"(?P<qual_t>{_TITLE}){_SEP}(?P<qual_y>\d{{4}}){_SEP}{_QUALITY_TAGS}"),
+    # Fallback: year at the very end of the stem
+    ("end",   rf"(?P<end_t>{_TITLE}){_SEP}(?P<end_y>\d{{4}})$"),
+)
+_TV_FORMS = frozenset({"se", "x"})
+_FILENAME_RE = re.compile(
+    "|".join(f"(?P<{form}>{pat})" for form, pat in _FILENAME_FORMS), re.IGNORECASE
+)
+
+# A title with no letter or digit ("", "-", "...") can't match anything on
+# TMDB, so it is answered as "no match" without a request
+_SEARCHABLE = re.compile(r"[^\W_]")
+
+
+# ── Lookup cache ──────────────────────────────────────────────────────────────
+# A season of a show (or a folder of one movie's extras) parses to the same
+# title, so search results are cached across files and MediaMatcher instances.
+_MISS = object()
+
+
+class _TTLCache:
+    """Thread-safe TTL + LRU cache; concurrent misses on one key compute once."""
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl     = ttl
+        self._data: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock   = threading.Lock()
+        self._key_locks: Dict[tuple, threading.Lock] = {}
+
+    def get(self, key, default=_MISS):
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return default
+            expires, value = hit
+            if expires < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key, compute):
+        """Return the cached value, or call *compute()* once and cache it.
+
+        Exceptions from *compute* propagate and nothing is cached.
+        """
+        value = self.get(key)
+        if value is not _MISS:
+            return value
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                value = self.get(key)
+                if value is _MISS:
+                    value = compute()
+                    self.set(key, value)
+        finally:
+            with self._lock:
+                self._key_locks.pop(key, None)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_search_cache  = _TTLCache()   # ("movie", title, year) / ("tv", title) → result
+_episode_cache = _TTLCache()   # (show_id, season, episode) → episode dict
+
+
+class _ResponseCache:
+    """TMDB JSON responses persisted in SQLite, keyed on URL + query.
+
+    Outlives the process, so re-matching a library (or restarting the API)
+    doesn't repeat lookups already answered within *ttl* seconds. Opened on
+    first use; if the file can't be opened the cache just stays empty.
+    """
+
+    def __init__(self, path: Path, ttl: float):
+        self.path = path
+        self.ttl  = ttl
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._failed = ttl <= 0
+
+    def _conn(self) -> Optional[sqlite3.Connection]:
+        if self._db is None and not self._failed:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")   # a lost tail just means a re-fetch
+                db.execute("CREATE TABLE IF NOT EXISTS responses "
+                           "(key TEXT PRIMARY KEY, expires REAL, body BLOB)")
+                db.execute("DELETE FROM responses WHERE expires < ?", (time.time(),))
+                db.commit()
+                self._db = db
+            except sqlite3.Error as exc:
+                log.warning("TMDB response cache disabled (%s): %s", self.path, exc)
+                self._failed = True
+        return self._db
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            db = self._conn()
+            if db is None:
+                return None
+            try:
+                row = db.execute("SELECT body FROM responses WHERE key = ? AND expires >= ?",
+                                 (key, time.time())).fetchone()
+            except sqlite3.Error:
+                return None
+        return row[0] if row else None
+
+    def set(self, key: str, body: bytes):
+        with self._lock:
+            db = self._conn()
+            if db is None:
+                return
+            try:
+                db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                           (key, time.time() + self.ttl, body))
+                db.commit()
+            except sqlite3.Error as exc:
+                log.debug("TMDB response cache write failed: %s", exc)
+
+    def clear(self):
+        with self._lock:
+            db = self._conn()
+            if db is None:
+                return
+            try:
+                db.execute("DELETE FROM responses")
+                db.commit()
+            except sqlite3.Error as exc:
+                log.warning("Clearing TMDB response cache failed: %s", exc)
+
+
+def _cache_days() -> float:
+    """MR_TMDB_CACHE_DAYS, or 7 if it is unset or malformed."""
+    raw = os.environ.get("MR_TMDB_CACHE_DAYS", "7")
+    try:
+        return float(raw)
+    except ValueError:
+        log.warning("Ignoring invalid MR_TMDB_CACHE_DAYS=%r; using 7", raw)
+        return 7.0
+
+
+_response_cache = _ResponseCache(
+    Path.home() / ".mediarenamer" / "tmdb_cache.sqlite",
+    ttl=_cache_days() * 86400,
+)
+
+
+
+def clear_lookup_cache():
+    """Forget every cached TMDB search, episode and response, in memory and
+    on disk, so the next match asks TMDB again."""
+    _search_cache.clear()
+    _episode_cache.clear()
+    _response_cache.clear()
+
+
+# Files matched at once by MediaMatcher.iter_matches / match_files
+MATCH_WORKERS = 8
+
+
+# ── HTTP session ──────────────────────────────────────────────────────────────
+# One keep-alive pool for every MediaMatcher that isn't handed a session, so
+# a batch of matches reuses TLS connections to TMDB instead of opening new ones.
+_HEADERS = {
+    "User-Agent": "MediaRenamer/1.0",
+    "Accept": "application/json",
+}
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _shared_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers.update(_HEADERS)
+            adapter = HTTPAdapter(
+                pool_connections=32, pool_maxsize=32,
+                # raise_on_status=False: once retries run out, _get still sees
+                # the response and reports the status in its own words
+                max_retries=Retry(total=3, backoff_factor=0.3,
+                                  status_forcelist=(429, 500, 502, 503, 504),
+                                  raise_on_status=False),
+            )
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
 def _is_unconfigured(key: str) -> bool:
     return not key or key.strip() in _PLACEHOLDERS
 
@@ -62,7 +342,7 @@ def _read_tvdb_key() -> str:
 class MediaMatcher:
     """Matches media files with online databases."""
 
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         # Read keys at instantiation time, not at module import time.
         # This means calling MediaMatcher() after the user saves their key
         # in the Settings dialog will pick up the correct value.
@@ -72,14 +352,24 @@ class MediaMatcher:
         self.tmdb_base_url = "https://api.themoviedb.org/3"
         self.tvdb_base_url = "https://api4.thetvdb.com/v4"
 
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "MediaRenamer/1.0",
-            "Accept": "application/json",
-        })
+        # Callers (e.g. the API job queue) may pass their own pooled session;
+        # otherwise every matcher shares one, whose headers are set once.
+        if session is not None:
+            session.headers.update(_HEADERS)
+        self.session = session or _shared_session()
 
         self.media_info_extractor = MediaInfoExtractor() if MediaInfoExtractor else None
 
+    @property
+    def tmdb_api_key(self) -> str:
+        return self._tmdb_api_key
+
+    @tmdb_api_key.setter
+    def tmdb_api_key(self, key: str):
+        # Checked once here rather than on every lookup
+        self._tmdb_api_key    = key
+        self._tmdb_configured = not _is_unconfigured(key)
+
     # ── Public API ─────────────────────────────────────────────────────────────
 
     def match_file(
@@ -93,9 +383,14 @@ class MediaMatcher:
         Raises exceptions on hard errors (bad key, network failure) so the
         caller (MatchWorker) can surface the real reason to the UI.
         """
-        filename = os.path.basename(file_path)
-        info = self._parse_filename(filename)
+        info = self._parse_filename(os.path.basename(file_path))
+        return self._match_parsed(file_path, info, data_source, extract_media_info)
 
+    def _match_parsed(
+        self, file_path: str, info: Dict, data_source: str, extract_media_info: bool
+    ) -> Optional[Dict]:
+        """match_file() for a filename already run through _parse_filename."""
+        filename = os.path.basename(file_path)
         log.debug("Parsed '%s' → %s", filename, info)
 
         if data_source == "TheMovieDB":
@@ -114,9 +409,82 @@ class MediaMatcher:
 
         return match_result
 
+    def iter_matches(
+        self,
+        file_paths: Iterable[str],
+        data_source: str = "TheMovieDB",
+        extract_media_info: bool = True,
+        workers: int = MATCH_WORKERS,
+    ) -> Iterator[Tuple[int, Optional[Dict], Optional[Exception]]]:
+        """Match many files concurrently, yielding ``(index, match, error)``
+        in completion order as each one finishes.
+
+        Names are parsed up front and grouped by title: the first file of each
+        title is queued before the rest, so the distinct searches run side by
+        side and the other files (say, the episodes of a season) only find
+        them in the lookup cache and fetch their own episode details.
+        Closing the iterator early cancels files not yet started.
+        """
+        file_paths = list(file_paths)
+        parsed = parse_filenames(map(os.path.basename, file_paths))
+        groups: Dict[tuple, List[Tuple[int, Dict]]] = defaultdict(list)
+        for i, info in enumerate(parsed):
+            groups[(info["title"].lower(), info["year"], info["is_tv"])].append((i, info))
+        order = [g[0] for g in groups.values()] + [job for g in groups.values() for job in g[1:]]
+
+        def one(i: int, info: Dict):
+            try:
+                return i, self._match_parsed(file_paths[i], info, data_source, extract_media_info), None
+            except Exception as exc:
+                return i, None, exc
+
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mr-match")
+        try:
+            futures = [pool.submit(one, i, info) for i, info in order]
+            for fut in as_completed(futures):
+                yield fut.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def match_files(
+        self,
+        file_paths: Iterable[str],
+        data_source: str = "TheMovieDB",
+        extract_media_info: bool = True,
+    ) -> List[Tuple[Optional[Dict], Optional[Exception]]]:
+        """iter_matches() collected as ``(match, error)`` pairs in input order."""
+        file_paths = list(file_paths)
+        results: List[Tuple[Optional[Dict], Optional[Exception]]] = [(None, None)] * len(file_paths)
+        for i, match, error in self.iter_matches(file_paths, data_source, extract_media_info):
+            results[i] = (match, error)
+        return results
+
+    def match_season(
+        self, show_query: str, episodes: Iterable[Tuple[int, int]]
+    ) -> List[Optional[Dict]]:
+        """Match ``(season, episode)`` pairs of one TMDB show, in input order.
+
+        The show is searched once and the episode details are fetched
+        concurrently. Returns ``[]`` if no show matches *show_query*.
+        """
+        if not self._tmdb_configured:
+            raise ValueError(
+                "TMDB API key is not set. Open Settings and paste your key."
+            )
+        if not _SEARCHABLE.search(show_query):
+            return []
+        show = _search_cache.get_or_set(
+            ("tv", show_query.lower()), lambda: self._search_tmdb_show(show_query)
+        )
+        if not show:
+            return []
+        episodes = list(episodes)
+        details  = self._get_tmdb_episodes(show.get("id"), episodes)
+        return [self._tv_match(show, s, e, details[(s, e)]) for s, e in episodes]
+
     def search_movies(self, query: str, year: Optional[int] = None) -> List[Dict]:
         """Search TMDB for movies matching *query*, returning up to 10 results."""
-        if _is_unconfigured(self.tmdb_api_key):
+        if not self._tmdb_configured or not _SEARCHABLE.search(query):
             return []
         params: Dict = {"api_key": self.tmdb_api_key, "query": query}
         if year:
@@ -139,7 +507,7 @@ class MediaMatcher:
 
     def search_tv_shows(self, query: str) -> List[Dict]:
         """Search TMDB for TV shows matching *query*, returning up to 10 results."""
-        if _is_unconfigured(self.tmdb_api_key):
+        if not self._tmdb_configured or not _SEARCHABLE.search(query):
             return []
         try:
             resp = self._get(
@@ -163,78 +531,8 @@ class MediaMatcher:
     # ── Filename parser ────────────────────────────────────────────────────────
 
     def _parse_filename(self, filename: str) -> Dict:
-        """Extract title, year, season and episode from a filename stem.
-
-        Handles common scene/release naming conventions:
-          Show.Name.S01E02.1080p.mkv
-          Show.Name.1x02.mkv
-          Movie.Title.2024.BluRay.mkv
-          Movie.Title.(2024).mkv
-        """
-        stem = Path(filename).stem
-        info: Dict = {
-            "title": stem,
-            "year": None,
-            "season": None,
-            "episode": None,
-            "is_tv": False,
-        }
-
-        # ── TV patterns ────────────────────────────────────────────────────────
-        tv_patterns = [
-            # S01E02 / S01E02E03
-            (r"^(.+?)[\.\s_]+[Ss](\d{1,2})[Ee](\d{1,2})", True),
-            # 1x02
-            (r"^(.+?)[\.\s_]+(\d{1,2})x(\d{1,2})", True),
-        ]
-        for pattern, is_tv in tv_patterns:
-            m = re.search(pattern, stem, re.IGNORECASE)
-            if m:
-                info["title"]   = _clean_title(m.group(1))
-                info["season"]  = int(m.group(2))
-                info["episode"] = int(m.group(3))
-                info["is_tv"]   = True
-                return info
-
-        # ── Movie patterns ─────────────────────────────────────────────────────
-        # "(2024)" with parentheses — very reliable
-        m = re.search(r"^(.+?)[\.\s_]+\((\d{4})\)", stem)
-        if m:
-            info["title"] = _clean_title(m.group(1))
-            info["year"]  = int(m.group(2))
-            return info
-
-        # "Title.2024.Quality..." — year must be followed by a non-title token
-        # so we don't confuse "The.100.Show" with year=100.
-        # Require the year to be followed by end-of-string OR a quality/source tag.
-        quality_tags = (
-            r"(?:BluRay|Blu-Ray|BDRip|BRRip|WEB-?DL|WEBRip|HDTV|DVDRip|"
-            r"DVDScr|HDRip|AMZN|NF|DSNP|HMAX|ATVP|"
-            r"\d{3,4}p|x264|x265|h264|h265|HEVC|AVC|"
-            r"AAC|AC3|DTS|DD5|TrueHD|FLAC|MP3|"
-            r"REMUX|PROPER|REPACK|EXTENDED|THEATRICAL|"
-            r"[-\[])"
-        )
-        m = re.search(
-            r"^(.+?)[\.\s_]+(\d{4})[\.\s_]+" + quality_tags,
-            stem,
-            re.IGNORECASE,
-        )
-        if m:
-            info["title"] = _clean_title(m.group(1))
-            info["year"]  = int(m.group(2))
-            return info
-
-        # Fallback: year at the very end of the stem
-        m = re.search(r"^(.+?)[\.\s_]+(\d{4})$", stem)
-        if m:
-            info["title"] = _clean_title(m.group(1))
-            info["year"]  = int(m.group(2))
-            return info
-
-        # Last resort: just clean up the raw stem
-        info["title"] = _clean_title(stem)
-        return info
+        """See parse_filename()."""
+        return parse_filename(filename)
 
     # ── Internal TMDB helpers ──────────────────────────────────────────────────
 
@@ -242,11 +540,19 @@ class MediaMatcher:
         return self._match_tmdb_tv(info) if info["is_tv"] else self._match_tmdb_movie(info)
 
     def _match_tmdb_movie(self, info: Dict) -> Optional[Dict]:
-        if _is_unconfigured(self.tmdb_api_key):
+        if not self._tmdb_configured:
             raise ValueError(
                 "TMDB API key is not set. Open Settings and paste your key."
             )
+        if not _SEARCHABLE.search(info["title"]):
+            return None
 
+        key = ("movie", info["title"].lower(), info.get("year"))
+        movie = _search_cache.get_or_set(key, lambda: self._search_tmdb_movie(info))
+        # Callers merge media info into the result, so never hand out the cached dict
+        return dict(movie) if movie else None
+
+    def _search_tmdb_movie(self, info: Dict) -> Optional[Dict]:
         params: Dict = {"api_key": self.tmdb_api_key, "query": info["title"]}
         if info.get("year"):
             params["year"] = info["year"]
@@ -273,47 +579,78 @@ class MediaMatcher:
         }
 
     def _match_tmdb_tv(self, info: Dict) -> Optional[Dict]:
-        if _is_unconfigured(self.tmdb_api_key):
+        if not self._tmdb_configured:
             raise ValueError(
                 "TMDB API key is not set. Open Settings and paste your key."
             )
+        if not _SEARCHABLE.search(info["title"]):
+            return None
 
-        data = self._get(
-            f"{self.tmdb_base_url}/search/tv",
-            {"api_key": self.tmdb_api_key, "query": info["title"]},
+        show = _search_cache.get_or_set(
+            ("tv", info["title"].lower()), lambda: self._search_tmdb_show(info["title"])
         )
-        results = data.get("results", [])
-        if not results:
+        if not show:
             return None
 
-        show = results[0]
         episode_info = self._get_tmdb_episode(
             show.get("id"), info.get("season"), info.get("episode")
         )
+        return self._tv_match(show, info.get("season"), info.get("episode"), episode_info)
+
+    @staticmethod
+    def _tv_match(show: Dict, season: Optional[int], episode: Optional[int],
+                  episode_info: Optional[Dict]) -> Dict:
         return {
             "title":         show.get("name"),
             "year":          (show.get("first_air_date") or "")[:4] or None,
-            "season":        info.get("season"),
-            "episode":       info.get("episode"),
+            "season":        season,
+            "episode":       episode,
             "episode_title": (episode_info or {}).get("name"),
             "tmdb_id":       show.get("id"),
             "type":          "tv",
             "overview":      show.get("overview", ""),
         }
 
+    def _search_tmdb_show(self, title: str) -> Optional[Dict]:
+        data = self._get(
+            f"{self.tmdb_base_url}/search/tv",
+            {"api_key": self.tmdb_api_key, "query": title},
+        )
+        results = data.get("results", [])
+        return results[0] if results else None
+
     def _get_tmdb_episode(
         self, show_id: int, season: Optional[int], episode: Optional[int]
     ) -> Optional[Dict]:
         if not (show_id and season and episode):
             return None
         try:
-            return self._get(
-                f"{self.tmdb_base_url}/tv/{show_id}/season/{season}/episode/{episode}",
-                {"api_key": self.tmdb_api_key},
+            return _episode_cache.get_or_set(
+                (show_id, season, episode),
+                lambda: self._get(
+                    f"{self.tmdb_base_url}/tv/{show_id}/season/{season}/episode/{episode}",
+                    {"api_key": self.tmdb_api_key},
+                ),
             )
         except Exception:
             return None
 
+    def _get_tmdb_episodes(
+        self, show_id: int, pairs: Iterable[Tuple[int, int]]
+    ) -> Dict[Tuple[int, int], Optional[Dict]]:
+        """_get_tmdb_episode() for many ``(season, episode)`` pairs at once.
+
+        The requests are independent, so they run side by side on the pooled
+        session instead of one round trip after another.
+        """
+        pairs = list(dict.fromkeys(pairs))
+        if len(pairs) <= 1:
+            return {(s, e): self._get_tmdb_episode(show_id, s, e) for s, e in pairs}
+        with ThreadPoolExecutor(max_workers=min(MATCH_WORKERS, len(pairs)),
+                                thread_name_prefix="mr-episode") as pool:
+            found = pool.map(lambda p: self._get_tmdb_episode(show_id, *p), pairs)
+            return dict(zip(pairs, found))
+
     def _match_tvdb(self, info: Dict) -> Optional[Dict]:
         """TheTVDB v4 requires subscriber PIN auth; fall back to TMDB for now."""
         log.info("TheTVDB not fully implemented — falling back to TheMovieDB.")
@@ -322,7 +659,15 @@ class MediaMatcher:
     # ── Low-level HTTP ─────────────────────────────────────────────────────────
 
     def _get(self, url: str, params: Dict) -> Dict:
-        """GET *url* with *params*. Raises a descriptive RuntimeError on failure."""
+        """GET *url* with *params*. Raises a descriptive RuntimeError on failure.
+
+        Successful responses are served from / stored in _response_cache.
+        """
+        cache_key = url + "?" + urlencode(sorted((k, v) for k, v in params.items() if k != "api_key"))
+        body = _response_cache.get(cache_key)
+        if body is not None:
+            return orjson.loads(body)
+
         try:
             resp = self.session.get(url, params=params, timeout=15)
         except requests.exceptions.ConnectionError as exc:
@@ -347,14 +692,76 @@ class MediaMatcher:
             raise RuntimeError(
                 f"TMDB returned HTTP {resp.status_code} for {url!r}: {resp.text[:200]}"
             )
+        content_type = resp.headers.get("Content-Type", "")
+        if "json" not in content_type:
+            # e.g. a captive portal's HTML page served with 200 — don't parse it
+            raise RuntimeError(f"Non-JSON response ({content_type or 'no content type'}) from {url!r}")
+
+        data = orjson.loads(resp.content)
+        if resp.status_code == 200:
+            _response_cache.set(cache_key, resp.content)
+        return data
+
+
+# ── Filename parser ────────────────────────────────────────────────────────────
+
+def parse_filename(filename: str) -> Dict:
+    """Extract title, year, season and episode from a filename stem.
+
+    Handles common scene/release naming conventions:
+      Show.Name.S01E02.1080p.mkv
+      Show.Name.1x02.mkv
+      Movie.Title.2024.BluRay.mkv
+      Movie.Title.(2024).mkv
+    """
+    stem = _stem(filename)
+    info: Dict = {
+        "title": stem,
+        "year": None,
+        "season": None,
+        "episode": None,
+        "is_tv": False,
+    }
+
+    m = _FILENAME_RE.match(stem)
+    if m:
+        form = m.lastgroup
+        info["title"] = _clean_title(m.group(form + "_t"))
+        if form in _TV_FORMS:
+            info["season"]  = int(m.group(form + "_s"))
+            info["episode"] = int(m.group(form + "_e"))
+            info["is_tv"]   = True
+        else:
+            info["year"]    = int(m.group(form + "_y"))
+        return info
+
+    # Last resort: just clean up the raw stem
+    info["title"] = _clean_title(stem)
+    return info
 
-        return resp.json()
+
+def parse_filenames(filenames: Iterable[str]) -> List[Dict]:
+    """parse_filename() over a whole folder's worth of names."""
+    return list(map(parse_filename, filenames))
 
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
+_PATH_SEPS = tuple({"/", os.sep, os.altsep} - {None})
+
+
+def _stem(filename: str) -> str:
+    """Path(filename).stem without building a Path for the usual bare name."""
+    if filename in ("", ".") or filename.endswith(".") or any(sep in filename for sep in _PATH_SEPS):
+        return Path(filename).stem
+    dot = filename.rfind(".")
+    return filename[:dot] if dot > 0 else filename
+
+
 def _clean_title(raw: str) -> str:
-    """Turn 'The.Dark.Knight' or 'The_Dark_Knight' into 'The Dark Knight'."""
-    title = re.sub(r"[._]+", " ", raw)
-    title = title.strip()
-    return title
+    """Turn 'The.Dark.Knight' or 'The_Dark_Knight' into 'The Dark Knight'.
+
+    Plain str methods rather than a regex substitution; split()/join also
+    collapses runs of separators and whitespace into single spaces.
+    """
+    return " ".join(raw.replace(".", " ").replace("_", " ").split())
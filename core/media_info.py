@@ -3,7 +3,16 @@ Media information extractor - extracts technical details from video files using
 """
 
 import os
-from typing import Dict, Optional
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import orjson
+
+from .scanner import MEDIA_EXTENSIONS, media_matcher
 
 try:
     from pymediainfo import MediaInfo
@@ -12,6 +21,112 @@ except ImportError:
     MEDIAINFO_AVAILABLE = False
 
 
+# Only these are handed to libmediainfo; posters, .nfo and .srt files next
+# to the videos are answered with {} without being opened
+_is_video = media_matcher(MEDIA_EXTENSIONS | {"webm", "ts", "m2ts"})
+
+# Parsed results by (path, mtime_ns, size), shared by every extractor in the
+# process: re-matching files that haven't changed skips MediaInfo.parse.
+# Backed by _disk_cache so the results also survive a restart.
+_CACHE_SIZE = 8192
+_cache: "OrderedDict[tuple, Dict[str, str]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Everything _extract reads is in the container headers, so libmediainfo is
+# told not to scan into the streams or probe for numbered sibling files
+# (name001.mkv, name002.mkv, …). full=True stays: without it pymediainfo
+# returns display strings ("1 s 0 ms") instead of the numbers used below.
+_PARSE_OPTIONS = {
+    "parse_speed": 0.0,
+    "mediainfo_options": {"File_TestContinuousFileNames": "0"},
+}
+
+# Codec name normalization: the first needle found in the upper-cased codec
+# id wins, so order matters (e.g. "V_MPEG4/ISO/AVC" is AVC, not MPEG)
+_VIDEO_CODECS = (
+    ("AVC", "AVC"), ("H264", "AVC"), ("X264", "AVC"),
+    ("HEVC", "HEVC"), ("H265", "HEVC"), ("X265", "HEVC"),
+    ("MPEG", "MPEG"), ("VP9", "VP9"), ("VP8", "VP8"),
+)
+_AUDIO_CODECS = (
+    ("DTS", "DTS"), ("AC3", "AC3"), ("DOLBY", "AC3"), ("AAC", "AAC"),
+    ("MP3", "MP3"), ("FLAC", "FLAC"), ("OPUS", "OPUS"),
+)
+
+# Height → resolution label, tallest first; shorter video is labelled "<height>p"
+_RESOLUTIONS = ((2160, '2160p'), (1440, '1440p'), (1080, '1080p'), (720, '720p'), (480, '480p'))
+# Channel count → layout name
+_CHANNEL_LAYOUTS = {'2': '2.0', '6': '5.1', '8': '7.1'}
+
+
+def _normalize(codec: str, table) -> str:
+    """Canonical name for *codec* from *table*, or *codec* itself if none fits"""
+    codec_upper = codec.upper()
+    for needle, name in table:
+        if needle in codec_upper:
+            return name
+    return codec
+
+
+class _DiskCache:
+    """Parsed results persisted in SQLite, one row per path.
+
+    A row is only used while the file's mtime and size still match, and is
+    replaced when the file changes, so re-scanning a library after a restart
+    doesn't run MediaInfo on files it has already seen. Opened on first use;
+    if the file can't be opened the cache just stays empty.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._failed = False
+
+    def _conn(self) -> Optional[sqlite3.Connection]:
+        if self._db is None and not self._failed:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")   # a lost tail just means a re-parse
+                db.execute("CREATE TABLE IF NOT EXISTS media_info "
+                           "(path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, info BLOB)")
+                db.commit()
+                self._db = db
+            except sqlite3.Error as e:
+                print(f"Media info cache disabled ({self.path}): {e}")
+                self._failed = True
+        return self._db
+
+    def get(self, key: tuple) -> Optional[Dict[str, str]]:
+        with self._lock:
+            db = self._conn()
+            if db is None:
+                return None
+            try:
+                row = db.execute("SELECT info FROM media_info "
+                                 "WHERE path = ? AND mtime_ns = ? AND size = ?", key).fetchone()
+            except sqlite3.Error:
+                return None
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, key: tuple, info: Dict[str, str]):
+        with self._lock:
+            db = self._conn()
+            if db is None:
+                return
+            try:
+                db.execute("INSERT OR REPLACE INTO media_info VALUES (?, ?, ?, ?)",
+                           (*key, orjson.dumps(info)))
+                db.commit()
+            except sqlite3.Error:
+                pass
+
+
+_disk_cache = _DiskCache(Path.home() / ".mediarenamer" / "mediainfo_cache.sqlite")
+
+
 class MediaInfoExtractor:
     """Extracts technical metadata from media files"""
     
@@ -22,122 +137,102 @@ class MediaInfoExtractor:
             print("Install with: pip install pymediainfo")
     
     def extract_info(self, file_path: str) -> Dict[str, str]:
-        """Extract media information from file"""
-        if not self.available:
+        """Extract media information from file (cached until the file changes)"""
+        if not self.available or not _is_video(file_path):
             return {}
-            
+
+        try:
+            st = os.stat(file_path)
+        except OSError as e:
+            print(f"Error extracting media info: {e}")
+            return {}
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        with _cache_lock:
+            info = _cache.get(key)
+            if info is not None:
+                _cache.move_to_end(key)
+                return dict(info)
+
+        info = _disk_cache.get(key)
+        if info is None:
+            info = self._extract(file_path)
+            if info is None:
+                return {}
+            _disk_cache.set(key, info)
+        with _cache_lock:
+            _cache[key] = info
+            if len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+        return dict(info)
+
+    def extract_info_batch(self, paths: Iterable[str],
+                           max_workers: Optional[int] = None) -> Dict[str, Dict[str, str]]:
+        """extract_info() for many files at once, as ``{path: info}``.
+
+        libmediainfo does its parsing and file I/O without holding the GIL,
+        so threads are enough to keep several files in flight.
+        """
+        paths = list(dict.fromkeys(paths))
+        if len(paths) <= 1 or not self.available:
+            return {fp: self.extract_info(fp) for fp in paths}
+        workers = min(max_workers or os.cpu_count() or 4, len(paths))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mr-mediainfo") as pool:
+            return dict(zip(paths, pool.map(self.extract_info, paths)))
+
+    def _extract(self, file_path: str) -> Optional[Dict[str, str]]:
+        """Run MediaInfo on *file_path*; None if it fails"""
         try:
-            media_info = MediaInfo.parse(file_path)
+            media_info = MediaInfo.parse(file_path, **_PARSE_OPTIONS)
             
             info = {}
             
-            # Video track
+            # First Video, Audio and General track, in one pass over the tracks
+            pending = {'Video', 'Audio', 'General'}
             for track in media_info.tracks:
-                if track.track_type == 'Video':
+                track_type = track.track_type
+                if track_type not in pending:
+                    continue
+                pending.discard(track_type)
+
+                if track_type == 'Video':
                     # Resolution
                     width = track.width
                     height = track.height
                     if width and height:
-                        if height >= 2160:
-                            info['resolution'] = '2160p'
-                            info['vf'] = '2160p'
-                        elif height >= 1440:
-                            info['resolution'] = '1440p'
-                            info['vf'] = '1440p'
-                        elif height >= 1080:
-                            info['resolution'] = '1080p'
-                            info['vf'] = '1080p'
-                        elif height >= 720:
-                            info['resolution'] = '720p'
-                            info['vf'] = '720p'
-                        elif height >= 480:
-                            info['resolution'] = '480p'
-                            info['vf'] = '480p'
+                        for min_height, label in _RESOLUTIONS:
+                            if height >= min_height:
+                                break
                         else:
-                            info['resolution'] = f"{height}p"
-                            info['vf'] = f"{height}p"
+                            label = f"{height}p"
+                        info['resolution'] = info['vf'] = label
                     
                     # Video codec
                     codec = track.codec_id or track.codec
                     if codec:
                         # Normalize codec names
-                        codec_upper = codec.upper()
-                        if 'AVC' in codec_upper or 'H264' in codec_upper or 'X264' in codec_upper:
-                            info['vc'] = 'AVC'
-                            info['video_codec'] = 'AVC'
-                        elif 'HEVC' in codec_upper or 'H265' in codec_upper or 'X265' in codec_upper:
-                            info['vc'] = 'HEVC'
-                            info['video_codec'] = 'HEVC'
-                        elif 'MPEG' in codec_upper:
-                            info['vc'] = 'MPEG'
-                            info['video_codec'] = 'MPEG'
-                        elif 'VP9' in codec_upper:
-                            info['vc'] = 'VP9'
-                            info['video_codec'] = 'VP9'
-                        elif 'VP8' in codec_upper:
-                            info['vc'] = 'VP8'
-                            info['video_codec'] = 'VP8'
-                        else:
-                            info['vc'] = codec
-                            info['video_codec'] = codec
+                        info['vc'] = info['video_codec'] = _normalize(codec, _VIDEO_CODECS)
                     
                     # Bit depth
                     if track.bit_depth:
                         info['bit_depth'] = f"{track.bit_depth}bit"
                     
-                    break
-            
-            # Audio track
-            for track in media_info.tracks:
-                if track.track_type == 'Audio':
+                elif track_type == 'Audio':
                     # Audio codec/format
                     codec = track.codec_id or track.codec or track.format
                     if codec:
-                        codec_upper = codec.upper()
-                        if 'DTS' in codec_upper:
-                            info['ac'] = 'DTS'
-                            info['audio_codec'] = 'DTS'
-                        elif 'AC3' in codec_upper or 'DOLBY' in codec_upper:
-                            info['ac'] = 'AC3'
-                            info['audio_codec'] = 'AC3'
-                        elif 'AAC' in codec_upper:
-                            info['ac'] = 'AAC'
-                            info['audio_codec'] = 'AAC'
-                        elif 'MP3' in codec_upper:
-                            info['ac'] = 'MP3'
-                            info['audio_codec'] = 'MP3'
-                        elif 'FLAC' in codec_upper:
-                            info['ac'] = 'FLAC'
-                            info['audio_codec'] = 'FLAC'
-                        elif 'OPUS' in codec_upper:
-                            info['ac'] = 'OPUS'
-                            info['audio_codec'] = 'OPUS'
-                        else:
-                            info['ac'] = codec
-                            info['audio_codec'] = codec
+                        info['ac'] = info['audio_codec'] = _normalize(codec, _AUDIO_CODECS)
                     
                     # Audio channels
                     if track.channel_s:
-                        channels = track.channel_s
-                        if channels == '2':
-                            info['channels'] = '2.0'
-                        elif channels == '6':
-                            info['channels'] = '5.1'
-                        elif channels == '8':
-                            info['channels'] = '7.1'
-                        else:
-                            info['channels'] = channels
+                        channels = str(track.channel_s)
+                        info['channels'] = _CHANNEL_LAYOUTS.get(channels, channels)
                     
                     # Audio bitrate
                     if track.bit_rate:
                         bitrate = int(track.bit_rate) // 1000  # Convert to kbps
                         info['audio_bitrate'] = f"{bitrate}kbps"
                     
-                    break
-            
-            # General file info
-            for track in media_info.tracks:
-                if track.track_type == 'General':
+                else:  # General file info
                     # File size
                     if track.file_size:
                         size_mb = int(track.file_size) // (1024 * 1024)
@@ -149,10 +244,11 @@ class MediaInfoExtractor:
                         duration_min = duration_ms // 60000
                         info['duration'] = f"{duration_min}min"
                     
+                if not pending:
                     break
             
             return info
             
         except Exception as e:
             print(f"Error extracting media info: {e}")
-            return {}
+            return None
@@ -3,8 +3,9 @@ Metadata writer - writes metadata to video files
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 try:
     from mutagen.mp4 import MP4
@@ -20,6 +21,20 @@ except ImportError:
     MUTAGEN_GENERAL_AVAILABLE = False
 
 
+# MP4 atom → match_info key
+_TAG_TITLE = '\xa9nam'
+_MP4_TAGS = (
+    (_TAG_TITLE, 'title'),
+    ('\xa9day', 'year'),
+    ('\xa9des', 'overview'),   # description/plot
+    ('\xa9gen', 'genres'),
+)
+_MP4_TV_TAGS = (
+    ('tvsn', 'season'),
+    ('tves', 'episode'),
+)
+
+
 class MetadataWriter:
     """Writes metadata to media files"""
     
@@ -49,6 +64,18 @@ class MetadataWriter:
             print(f"Error writing metadata: {e}")
             return False
     
+    def write_metadata_batch(
+        self, jobs: Iterable[Tuple[str, Dict, Optional[str]]], max_workers: Optional[int] = None
+    ) -> List[bool]:
+        """write_metadata() for many ``(file_path, match_info, poster_path)``
+        jobs at once; results are in job order."""
+        jobs = list(jobs)
+        if len(jobs) <= 1:
+            return [self.write_metadata(*job) for job in jobs]
+        workers = min(max_workers or min(8, os.cpu_count() or 1), len(jobs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mr-metadata") as pool:
+            return list(pool.map(lambda job: self.write_metadata(*job), jobs))
+    
     def _write_mp4_metadata(self, file_path: str, match_info: Dict, poster_path: Optional[str] = None) -> bool:
         """Write metadata to MP4 file"""
         if not MUTAGEN_AVAILABLE:
@@ -56,42 +83,39 @@ class MetadataWriter:
         
         try:
             video = MP4(file_path)
+            tags: Dict[str, list] = {}
             
-            # Title
-            if match_info.get('title'):
-                video['\xa9nam'] = match_info['title']
-            
-            # Year
-            if match_info.get('year'):
-                video['\xa9day'] = match_info['year']
-            
-            # Description/Plot
-            if match_info.get('overview'):
-                video['\xa9des'] = match_info['overview']
-            
-            # Genre
-            if match_info.get('genres'):
-                video['\xa9gen'] = match_info['genres']
+            for tag, key in _MP4_TAGS:
+                value = match_info.get(key)
+                if value:
+                    tags[tag] = value if isinstance(value, list) else [value]
             
             # TV Show specific
             if match_info.get('type') == 'tv':
-                if match_info.get('season'):
-                    video['tvsn'] = [match_info['season']]
-                if match_info.get('episode'):
-                    video['tves'] = [match_info['episode']]
+                for tag, key in _MP4_TV_TAGS:
+                    if match_info.get(key):
+                        tags[tag] = [match_info[key]]
                 if match_info.get('episode_title'):
-                    video['\xa9nam'] = f"{match_info.get('title', '')} - {match_info['episode_title']}"
+                    tags[_TAG_TITLE] = [f"{match_info.get('title', '')} - {match_info['episode_title']}"]
             
             # Add poster/cover art
             if poster_path and os.path.exists(poster_path):
                 try:
                     with open(poster_path, 'rb') as f:
                         cover_data = f.read()
-                    video['covr'] = [MP4Cover(cover_data, imageformat=MP4Cover.FORMAT_JPEG)]
+                    tags['covr'] = [MP4Cover(cover_data, imageformat=MP4Cover.FORMAT_JPEG)]
                 except Exception as e:
                     print(f"Error adding cover art: {e}")
             
-            video.save()
+            # Saving rewrites the moov atom (slow on network shares), so
+            # files already tagged this way are left untouched
+            changed = False
+            for key, value in tags.items():
+                if video.get(key) != value:
+                    video[key] = value
+                    changed = True
+            if changed:
+                video.save()
             return True
         except Exception as e:
             print(f"Error writing MP4 metadata: {e}")
@@ -3,10 +3,11 @@ Naming scheme preset manager.
 Includes built-in presets for Plex, Kodi, Jellyfin, FileBot style, and Anime.
 """
 
-import json
 import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+import orjson
 
 
 # Ordered built-ins — these are always present; user presets are merged on top
@@ -43,26 +44,33 @@ class PresetManager:
             Path.home() / ".mediarenamer" / "presets.json"
         )
         self._user_presets: Dict[str, str] = {}
-        Path(self.presets_file).parent.mkdir(parents=True, exist_ok=True)
-        self._load()
+        self._merged: Optional[Dict[str, str]] = None   # cached `presets` view
+        self._mtime: Optional[float] = None   # presets_file mtime at last load/save
+        self._loaded = False                  # presets_file is read on first use
 
     # ── Public API ────────────────────────────────────────────────────────────
 
     @property
     def presets(self) -> Dict[str, str]:
-        """Merged view: built-ins first, then user presets (user wins on conflict)."""
-        merged = dict(_BUILTIN_PRESETS)
-        merged.update(self._user_presets)
-        return merged
+        """Merged view: built-ins first, then user presets (user wins on conflict).
+
+        Built once and reused until the presets change; treat it as read-only.
+        """
+        self._ensure_loaded()
+        if self._merged is None:
+            self._merged = {**_BUILTIN_PRESETS, **self._user_presets}
+        return self._merged
 
     def get_preset(self, name: str) -> str:
         return self.presets.get(name, "")
 
     def save_preset(self, name: str, scheme: str):
+        self._ensure_loaded()
         self._user_presets[name] = scheme
         self._save()
 
     def delete_preset(self, name: str):
+        self._ensure_loaded()
         removed = False
         if name in self._user_presets:
             del self._user_presets[name]; removed = True
@@ -70,6 +78,7 @@ class PresetManager:
             self._save()
 
     def rename_preset(self, old_name: str, new_name: str):
+        self._ensure_loaded()
         if old_name in self._user_presets:
             self._user_presets[new_name] = self._user_presets.pop(old_name)
             self._save()
@@ -77,12 +86,32 @@ class PresetManager:
     def list_presets(self) -> List[str]:
         return list(self.presets.keys())
 
+    def reload_if_changed(self):
+        """Re-read presets_file if another process wrote it since we last did."""
+        if self._loaded and self._file_mtime() != self._mtime:
+            self._load()
+
     # ── Persistence ───────────────────────────────────────────────────────────
 
+    def _file_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.presets_file).st_mtime
+        except OSError:
+            return None
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self._load()
+
     def _load(self):
-        if os.path.exists(self.presets_file):
+        self._loaded = True
+        self._merged = None
+        self._mtime  = self._file_mtime()
+        if self._mtime is None:
+            self._user_presets = {}   # deleted since the last load
+        else:
             try:
-                data = json.loads(Path(self.presets_file).read_text())
+                data = orjson.loads(Path(self.presets_file).read_bytes())
                 # Strip out any old built-ins that were previously saved as user presets
                 self._user_presets = {k: v for k, v in data.items()
                                       if k not in _BUILTIN_PRESETS}
@@ -90,7 +119,10 @@ class PresetManager:
                 self._user_presets = {}
 
     def _save(self):
+        self._merged = None
         try:
-            Path(self.presets_file).write_text(json.dumps(self._user_presets, indent=2))
+            Path(self.presets_file).parent.mkdir(parents=True, exist_ok=True)
+            Path(self.presets_file).write_bytes(orjson.dumps(self._user_presets, option=orjson.OPT_INDENT_2))
+            self._mtime = self._file_mtime()
         except Exception as e:
             print(f"Error saving presets: {e}")
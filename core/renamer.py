@@ -3,64 +3,149 @@ File renamer - handles renaming logic
 """
 
 import os
+import errno
+import queue
 import shutil
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
 import re
 
 
+# errno values meaning "copy_file_range can't do this pair" → use sendfile
+_NO_COPY_RANGE = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+
+
+def copy_file(src: str, dst: str):
+    """Copy *src* to *dst* (data + metadata) without looping through Python.
+
+    Uses copy_file_range, which lets the kernel (or filesystem, e.g. reflinks
+    or NFS server-side copy) move the data. Falls back to shutil.copyfile,
+    which itself uses sendfile on Linux.
+    """
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            infd, outfd = fsrc.fileno(), fdst.fileno()
+            try:
+                while os.copy_file_range(infd, outfd, 1 << 30):
+                    pass
+                copied = True
+            except OSError as exc:
+                if exc.errno not in _NO_COPY_RANGE or os.fstat(outfd).st_size:
+                    raise
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def move_file(src: str, dst: str):
+    """Move *src* to *dst*: one rename(2) when on the same filesystem, else
+    copy + unlink. Like shutil.move, an existing *dst* is replaced."""
+    try:
+        os.replace(src, dst)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        copy_file(src, dst)
+        os.unlink(src)
+
+
+# A naming-scheme placeholder, e.g. {n} or {s00e00}
+_TOKEN_RE = re.compile(r"\{([a-z0-9_]+)\}")
+
+# Clean-up applied to every generated name
+_INVALID_CHARS = re.compile(r'[<>:"/\\|?*]')   # not allowed in a title
+_SLASHES       = re.compile(r"[/\\]+")
+_WHITESPACE    = re.compile(r"\s+")
+
+
+def _season(mi: Dict) -> str:
+    return f"S{int(mi.get('season', 0)):02d}" if mi.get('season') else ''
+
+
+def _episode(mi: Dict) -> str:
+    return f"E{int(mi.get('episode', 0)):02d}" if mi.get('episode') else ''
+
+
+# Placeholder → value from match_info
+_PLACEHOLDERS: Dict[str, Callable[[Dict], str]] = {
+    # Title without characters that are invalid in filenames
+    '{n}': lambda mi: _INVALID_CHARS.sub('', mi.get('title', 'Unknown')),
+    '{y}': lambda mi: mi.get('year', ''),
+    '{s}': _season,
+    '{e}': _episode,
+    '{s00e00}': lambda mi: _season(mi) + _episode(mi) if mi.get('season') and mi.get('episode') else '',
+    '{t}': lambda mi: mi.get('episode_title', '') or '',
+    # Media info placeholders
+    '{vf}': lambda mi: mi.get('vf', mi.get('resolution', '')),
+    '{vc}': lambda mi: mi.get('vc', mi.get('video_codec', '')),
+    # {af} = audio format (codec name), {ac} = audio channels (e.g. 5.1)
+    # This matches FileBot's naming convention.
+    '{af}': lambda mi: mi.get('ac', mi.get('audio_codec', '')),
+    '{ac}': lambda mi: mi.get('channels', ''),
+    '{resolution}': lambda mi: mi.get('resolution', ''),
+    '{video_codec}': lambda mi: mi.get('video_codec', mi.get('vc', '')),
+    '{audio_codec}': lambda mi: mi.get('audio_codec', mi.get('ac', '')),
+    '{channels}': lambda mi: mi.get('channels', ''),
+    '{bit_depth}': lambda mi: mi.get('bit_depth', ''),
+}
+
+
 class FileRenamer:
     """Handles file renaming operations"""
     
     def __init__(self, naming_scheme: str = None):
         self.naming_scheme = naming_scheme or "{n} ({y})/{n} ({y})"
+        self._compiled: Dict[str, Callable[[Dict[str, str]], str]] = {}
+        self.compile(self.naming_scheme)
+
+    def compile(self, scheme: str) -> Callable[[Dict[str, str]], str]:
+        """Parse *scheme* once into literal text and token names.
+
+        Returns a ``render(values)`` callable that fills each ``{token}`` from
+        *values* (keyed by placeholder, e.g. ``'{n}'``); unknown tokens are
+        left as-is. ``render.tokens`` holds the supported placeholders the
+        scheme contains. Compiled schemes are cached per instance.
+        """
+        render = self._compiled.get(scheme)
+        if render is None:
+            parts    = _TOKEN_RE.split(scheme)
+            literals = tuple(parts[0::2])
+            tokens   = tuple("{" + t + "}" for t in parts[1::2])
+            first, rest = literals[0], tuple(zip(tokens, literals[1:]))
+
+            def render(values: Dict[str, str]) -> str:
+                return first + "".join(
+                    [str(values.get(tok, tok)) + lit for tok, lit in rest]
+                )
+            # The known placeholders the scheme uses, for generate_new_name
+            render.tokens = frozenset(tokens) & _PLACEHOLDERS.keys()
+
+            if len(self._compiled) >= 64:   # e.g. GUI previews while typing
+                self._compiled.clear()
+            self._compiled[scheme] = render
+        return render
         
     def generate_new_name(self, file_path: str, match_info: Dict, naming_scheme: str = None) -> str:
         """Generate new filename based on match info and naming scheme"""
         scheme = naming_scheme or self.naming_scheme
+        name   = os.path.basename(file_path)
         
         if not match_info:
-            return os.path.basename(file_path)
+            return name
             
-        # Get file extension
-        ext = Path(file_path).suffix
-        
-        # Replace placeholders
-        new_name = scheme
-        
-        # Common placeholders
-        replacements = {
-            '{n}': match_info.get('title', 'Unknown'),
-            '{y}': match_info.get('year', ''),
-            '{s}': f"S{int(match_info.get('season', 0)):02d}" if match_info.get('season') else '',
-            '{e}': f"E{int(match_info.get('episode', 0)):02d}" if match_info.get('episode') else '',
-            '{s00e00}': f"S{int(match_info.get('season', 0)):02d}E{int(match_info.get('episode', 0)):02d}" if match_info.get('season') and match_info.get('episode') else '',
-            '{t}': match_info.get('episode_title', '') or '',
-            # Media info placeholders
-            '{vf}': match_info.get('vf', match_info.get('resolution', '')),
-            '{vc}': match_info.get('vc', match_info.get('video_codec', '')),
-            # {af} = audio format (codec name), {ac} = audio channels (e.g. 5.1)
-            # This matches FileBot's naming convention.
-            '{af}': match_info.get('ac', match_info.get('audio_codec', '')),
-            '{ac}': match_info.get('channels', ''),
-            '{resolution}': match_info.get('resolution', ''),
-            '{video_codec}': match_info.get('video_codec', match_info.get('vc', '')),
-            '{audio_codec}': match_info.get('audio_codec', match_info.get('ac', '')),
-            '{channels}': match_info.get('channels', ''),
-            '{bit_depth}': match_info.get('bit_depth', ''),
-        }
-        
-        # Clean up title (remove invalid filename characters)
-        title = match_info.get('title', 'Unknown')
-        title = re.sub(r'[<>:"/\\|?*]', '', title)
-        replacements['{n}'] = title
+        # Get file extension (Path(file_path).suffix, without building a Path)
+        dot = name.rfind('.')
+        ext = name[dot:] if 0 < dot < len(name) - 1 else ''
         
-        for placeholder, value in replacements.items():
-            new_name = new_name.replace(placeholder, str(value))
+        # Only the placeholders this scheme uses are computed
+        render = self.compile(scheme)
+        new_name = render({tok: _PLACEHOLDERS[tok](match_info) for tok in render.tokens})
             
         # Clean up multiple slashes and spaces
-        new_name = re.sub(r'[/\\]+', '/', new_name)
-        new_name = re.sub(r'\s+', ' ', new_name)
+        new_name = _SLASHES.sub('/', new_name)
+        new_name = _WHITESPACE.sub(' ', new_name)
         new_name = new_name.strip()
         
         # Add extension
@@ -78,18 +163,112 @@ class FileRenamer:
         new_name = self.generate_new_name(file_path, match_info)
         
         # Determine destination
+        src = Path(file_path)
         if output_dir:
             # Create directory structure if needed
             dest_path = Path(output_dir) / new_name
             dest_path.parent.mkdir(parents=True, exist_ok=True)
         else:
             # Rename in place
-            dest_path = Path(file_path).parent / new_name
+            dest_path = src.parent / new_name
             
         # Move/rename file
-        if dest_path.exists() and dest_path != Path(file_path):
+        if dest_path.exists() and dest_path != src:
             raise FileExistsError(f"Destination file already exists: {dest_path}")
             
-        shutil.move(file_path, str(dest_path))
+        move_file(file_path, str(dest_path))
         
         return str(dest_path)
+
+
+class Pipeline:
+    """Run items through a chain of stages so that the stages overlap.
+
+    ``Pipeline(extract, rename).run(paths)`` calls ``extract(path)`` and then
+    ``rename(<what extract returned>)`` for each path. Every stage has its own
+    worker threads, fed through a bounded queue, so one file can be renamed
+    while the next is still being probed and memory stays bounded however
+    many items there are. Yields ``(item, result, error)`` in completion
+    order; once a stage raises, the item skips the remaining stages and
+    comes out with the exception. An exception raised while iterating
+    *items* is re-raised once the items already fed have come out. Closing
+    the iterator early stops feeding new items and waits for the ones
+    already in a stage.
+
+    *workers* is the thread count for every stage, or a sequence with one
+    count per stage — e.g. more threads for a network-bound stage than for
+    a disk-bound one.
+    """
+
+    _DONE = object()
+
+    def __init__(self, *stages: Callable[[Any], Any],
+                 workers: Union[int, Sequence[int]] = 4, buffer: Optional[int] = None):
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        workers = (workers,) * len(stages) if isinstance(workers, int) else tuple(workers)
+        if len(workers) != len(stages) or min(workers) < 1:
+            raise ValueError("Pipeline needs a positive worker count per stage")
+        self.stages  = stages
+        self.workers = workers
+        self.buffer  = buffer
+
+    def run(self, items: Iterable) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+        stop   = threading.Event()
+        queues = [queue.Queue(self.buffer or 2 * n) for n in self.workers] + [queue.Queue()]
+        left   = list(self.workers)                  # workers still running per stage
+        lock   = threading.Lock()
+        failed: list = []                            # an exception raised by *items*
+
+        def feed():
+            try:
+                for item in items:
+                    if stop.is_set():
+                        break
+                    queues[0].put((item, item, None))
+            except Exception as exc:
+                failed.append(exc)
+            finally:
+                for _ in range(self.workers[0]):
+                    queues[0].put(self._DONE)
+
+        def work(k: int):
+            stage, inbox, outbox = self.stages[k], queues[k], queues[k + 1]
+            while True:
+                job = inbox.get()
+                if job is self._DONE:
+                    break
+                item, value, error = job
+                if error is None and not stop.is_set():
+                    try:
+                        value = stage(value)
+                    except Exception as exc:
+                        error = exc
+                elif error is None:
+                    continue   # stopped: drop items that haven't started here
+                outbox.put((item, value, error))
+            with lock:
+                left[k] -= 1
+                last = not left[k]
+            if last:   # the stage is drained: let the next one finish too
+                for _ in range(self.workers[k + 1] if k + 1 < len(self.stages) else 1):
+                    outbox.put(self._DONE)
+
+        threads = [threading.Thread(target=feed, name="mr-pipeline-feed", daemon=True)]
+        threads += [threading.Thread(target=work, args=(k,), name=f"mr-pipeline-{k}", daemon=True)
+                    for k in range(len(self.stages)) for _ in range(self.workers[k])]
+        for t in threads:
+            t.start()
+
+        out = queues[-1]
+        try:
+            while (job := out.get()) is not self._DONE:
+                yield job
+        finally:
+            if job is not self._DONE:
+                stop.set()
+                while out.get() is not self._DONE:
+                    pass
+        if failed:
+            raise failed[0]
+
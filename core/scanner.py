@@ -0,0 +1,73 @@
+"""
+Media file discovery shared by the CLI and the API.
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, Optional
+
+# Lower-case and without the dot
+MEDIA_EXTENSIONS = frozenset({"mp4", "mkv", "avi", "mov", "m4v", "mpg", "mpeg", "flv", "wmv"})
+
+# Directories never worth descending into (hidden ones are skipped as well):
+# tool caches, NAS thumbnail stores and OS recycle/system folders
+SKIP_DIRS = frozenset({
+    "node_modules", "__pycache__", "@eaDir", "#recycle", "#snapshot",
+    "$RECYCLE.BIN", "System Volume Information", "lost+found",
+})
+
+
+def normalize_extensions(exts: Iterable[str]) -> frozenset:
+    """``{".MKV", "mp4"}`` → ``frozenset({"mkv", "mp4"})`` for iter_media()."""
+    return frozenset(e.lower().lstrip(".") for e in exts)
+
+
+def skip_dir(name: str, extra: frozenset = frozenset()) -> bool:
+    """True for directory names the scanners prune: hidden, SKIP_DIRS, *extra*."""
+    return name[:1] == "." or name in SKIP_DIRS or name in extra
+
+
+@lru_cache(maxsize=32)
+def media_matcher(exts: frozenset = MEDIA_EXTENSIONS) -> Callable[[str], Optional[re.Match]]:
+    """Compiled ``match`` for names/paths ending in one of *exts*.
+
+    One anchored, case-insensitive regex tests the extension in C, without
+    slicing and lower-casing a suffix string per entry. Cached per extension
+    set, so custom ``ScanRequest.extensions`` compile once.
+    """
+    if not exts:
+        return re.compile(r"(?!)").match
+    alts = "|".join(re.escape(e) for e in sorted(exts, key=len, reverse=True))
+    return re.compile(rf"(?s).*\.(?:{alts})\Z", re.IGNORECASE).match
+
+
+is_media = media_matcher(MEDIA_EXTENSIONS)
+
+
+def iter_media(root: str, exts: frozenset = MEDIA_EXTENSIONS,
+               recursive: bool = True, exclude_dirs: Iterable[str] = ()) -> Iterator[str]:
+    """Yield paths of files under *root* whose extension is in *exts*.
+
+    *exts* are lower-case and without the dot. Walks with os.scandir so the
+    type checks reuse the directory entry, and yields plain strings — no
+    Path object per entry. Symlinked directories are not followed, and
+    subdirectories matching skip_dir() — plus any named in *exclude_dirs* —
+    are pruned without being listed.
+    """
+    match = media_matcher(exts)
+    extra = frozenset(exclude_dirs)
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    if not skip_dir(entry.name, extra):
+                        stack.append(entry.path)
+                    continue
+                if match(entry.name) and entry.is_file():
+                    yield entry.path
@@ -3,10 +3,29 @@ Subtitle fetcher - downloads subtitles from OpenSubtitles
 """
 
 import os
-import hashlib
+import shutil
+import struct
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+import orjson
+from requests.adapters import HTTPAdapter
+
+from .throttle import AdaptiveLimit
+
+_HASH_CHUNK = 64 * 1024   # bytes hashed from each end of the file
+
+# Files OpenSubtitles had nothing for ("hash:language" → time of the lookup)
+# aren't asked about again for this long
+_MISS_TTL = 7 * 86400
+
+# Most files looked up at once by fetch_subtitles(); kept modest for the
+# API's rate limit. The number actually in flight adapts below this.
+FETCH_WORKERS = 8
 
 
 class SubtitleFetcher:
@@ -19,13 +38,29 @@ class SubtitleFetcher:
             'User-Agent': 'MediaRenamer/1.0',
             'Accept': 'application/json'
         })
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=FETCH_WORKERS)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Batch concurrency follows throughput and backs off on 429/5xx
+        self.limit = AdaptiveLimit(maximum=FETCH_WORKERS)
+        self.session.hooks["response"].append(self.limit.observe)
+        self.miss_file = str(Path.home() / ".mediarenamer" / "sub_neg_cache.json")
+        self._misses: Optional[Dict[str, float]] = None   # read on first use
+        self._misses_lock = threading.Lock()
         
     def fetch_subtitle(self, file_path: str, language: str = "en") -> Optional[str]:
         """Fetch subtitle for a file"""
+        # Already have one: no hashing, no network
+        subtitle_path = Path(file_path).with_suffix('.srt')
+        if subtitle_path.exists():
+            return str(subtitle_path)
         try:
-            # Calculate file hash (simplified - OpenSubtitles uses specific hash algorithm)
+            # Calculate file hash
             file_hash = self._calculate_hash(file_path)
             file_size = os.path.getsize(file_path)
+            miss_key  = f"{file_hash}:{language}"
+            if time.time() - self._load_misses().get(miss_key, 0) < _MISS_TTL:
+                return None
             
             # Search for subtitles
             params = {
@@ -47,24 +82,80 @@ class SubtitleFetcher:
                     subtitle_id = subtitle_info.get('attributes', {}).get('files', [{}])[0].get('file_id')
                     
                     if subtitle_id:
-                        return self._download_subtitle(subtitle_id, file_path)
+                        return self._download_subtitle(subtitle_id, subtitle_path)
+                else:
+                    self._record_miss(miss_key)
         except Exception as e:
             print(f"Error fetching subtitle: {e}")
             
         return None
+
+    def fetch_subtitles(
+        self, file_paths: Iterable[str], language: str = "en", workers: int = FETCH_WORKERS
+    ) -> Iterator[Tuple[str, Optional[str]]]:
+        """fetch_subtitle() for many files, yielding ``(file_path, subtitle_path)``
+        in completion order.
+
+        Searches and downloads for different files overlap on the session's
+        connection pool instead of waiting one round trip after another; how
+        many run at once (up to *workers*) is set by ``self.limit``.
+        """
+        file_paths = list(file_paths)
+        if not file_paths:
+            return
+
+        def fetch(fp: str) -> Optional[str]:
+            with self.limit:
+                return self.fetch_subtitle(fp, language)
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(file_paths)),
+                                thread_name_prefix="mr-subtitle") as pool:
+            futures = {pool.submit(fetch, fp): fp for fp in file_paths}
+            for fut in as_completed(futures):
+                yield futures[fut], fut.result()
         
+    def _load_misses(self) -> Dict[str, float]:
+        if self._misses is None:
+            try:
+                self._misses = orjson.loads(Path(self.miss_file).read_bytes())
+            except (OSError, ValueError):
+                self._misses = {}
+        return self._misses
+
+    def _record_miss(self, key: str):
+        """Remember that *key* had no subtitle; expired entries are dropped."""
+        with self._misses_lock:
+            now    = time.time()
+            misses = {k: t for k, t in self._load_misses().items() if now - t < _MISS_TTL}
+            misses[key] = now
+            self._misses = misses
+            miss_path = Path(self.miss_file)
+            try:
+                miss_path.parent.mkdir(parents=True, exist_ok=True)
+                miss_path.write_bytes(orjson.dumps(misses))
+            except OSError as e:
+                print(f"Error saving subtitle cache: {e}")
+
     def _calculate_hash(self, file_path: str) -> str:
-        """Calculate OpenSubtitles hash"""
-        # OpenSubtitles uses a specific hash algorithm
-        # This is a simplified version
-        hash_md5 = hashlib.md5()
+        """Calculate the OpenSubtitles hash: file size plus the 64-bit
+        little-endian words of the first and last 64 KiB, mod 2**64.
+
+        Reads 128 KiB at most, however large the file is.
+        """
+        size = os.path.getsize(file_path)
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(65536), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            head = f.read(_HASH_CHUNK)
+            f.seek(max(0, size - _HASH_CHUNK))
+            tail = f.read(_HASH_CHUNK)
+        total = size
+        for chunk in (head, tail):
+            # Files under 64 KiB: zero-pad to whole words
+            chunk += b"\0" * (-len(chunk) % 8)
+            total += sum(struct.unpack(f"<{len(chunk) // 8}Q", chunk))
+        return f"{total & 0xFFFFFFFFFFFFFFFF:016x}"
         
-    def _download_subtitle(self, subtitle_id: int, file_path: str) -> Optional[str]:
-        """Download subtitle file"""
+    def _download_subtitle(self, subtitle_id: int, subtitle_path: Path) -> Optional[str]:
+        """Download subtitle file to *subtitle_path*"""
         try:
             # Get download link
             response = self.session.get(
@@ -78,14 +169,23 @@ class SubtitleFetcher:
                 download_link = data.get('link')
                 
                 if download_link:
-                    # Download subtitle
-                    sub_response = requests.get(download_link, timeout=30)
-                    if sub_response.status_code == 200:
-                        # Save subtitle
-                        subtitle_path = Path(file_path).with_suffix('.srt')
-                        with open(subtitle_path, 'wb') as f:
-                            f.write(sub_response.content)
-                        return str(subtitle_path)
+                    # Download subtitle, streamed straight to disk over the
+                    # session's kept-alive connection
+                    with self.session.get(download_link, timeout=30, stream=True) as sub_response:
+                        if sub_response.status_code == 200:
+                            # Save subtitle; written under a .part name and moved into
+                            # place once complete, so an interrupted transfer never
+                            # leaves a truncated .srt that later runs would accept
+                            sub_response.raw.decode_content = True
+                            part = subtitle_path.with_suffix('.srt.part')
+                            try:
+                                with open(part, 'wb') as f:
+                                    shutil.copyfileobj(sub_response.raw, f, 64 * 1024)
+                                os.replace(part, subtitle_path)
+                            except BaseException:
+                                part.unlink(missing_ok=True)
+                                raise
+                            return str(subtitle_path)
         except Exception as e:
             print(f"Error downloading subtitle: {e}")
             
@@ -0,0 +1,101 @@
+"""
+Adaptive concurrency for batches of network requests (artwork, subtitles).
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+
+class AdaptiveLimit:
+    """A semaphore whose size follows the measured throughput.
+
+    Jobs run inside ``with limit:``. Every *window* seconds the completion
+    rate is compared with the previous window's: a clear rise lets one more
+    job run, a clear fall lets one fewer. A throttling or server error seen
+    by observe() — a requests ``response`` hook — halves the limit at once,
+    at most once per window. That is additive increase / multiplicative
+    decrease, so the batch settles near what the link and the server
+    currently sustain instead of on a fixed thread count. Windows in which
+    a slot went unused say nothing about the limit and are not compared;
+    a new window starts when work resumes after the limit sat idle.
+    """
+
+    RISE = 1.05   # rate ratios that count as a real change, not noise
+    FALL = 0.90
+
+    def __init__(self, start: int = 4, minimum: int = 1, maximum: int = 16,
+                 window: float = 5.0):
+        self.minimum  = minimum
+        self.maximum  = maximum
+        self.window   = window
+        self.limit    = max(minimum, min(start, maximum))
+        self._cond    = threading.Condition()
+        self._active  = 0
+        self._waiting = 0                          # jobs blocked in __enter__
+        self._done    = 0
+        self._slack   = False                      # a slot went unused this window
+        self._start   = time.monotonic()           # current window
+        self._rate: Optional[float] = None         # previous window's jobs/s
+        self._cut_at  = float("-inf")
+
+    def __enter__(self):
+        with self._cond:
+            if not self._active:
+                # Resuming after idle time: don't measure the gap
+                self._reset(time.monotonic(), self._rate)
+            self._waiting += 1
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._waiting -= 1
+            self._active  += 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._cond:
+            self._active -= 1
+            self._done   += 1
+            if not self._waiting:
+                self._slack = True
+            self._adjust(time.monotonic())
+            self._cond.notify_all()
+
+    def observe(self, response, *args, **kwargs):
+        """``session.hooks["response"]`` callback: back off on 429 and 5xx."""
+        if response.status_code == 429 or response.status_code >= 500:
+            with self._cond:
+                now = time.monotonic()
+                if now - self._cut_at >= self.window:
+                    self._set(max(self.minimum, self.limit // 2), "server pushback")
+                    self._cut_at = now
+                    self._reset(now, rate=None)
+
+    def _adjust(self, now: float):
+        elapsed = now - self._start
+        if elapsed < self.window:
+            return
+        rate = self._done / elapsed
+        if self._slack:
+            # Demand, not the limit, set this window's rate
+            self._reset(now, self._rate)
+            return
+        if self._rate is None or rate > self._rate * self.RISE:
+            self._set(min(self.maximum, self.limit + 1), "throughput rose")
+        elif rate < self._rate * self.FALL:
+            self._set(max(self.minimum, self.limit - 1), "throughput fell")
+        self._reset(now, rate)
+
+    def _reset(self, now: float, rate: Optional[float]):
+        self._start = now
+        self._done  = 0
+        self._rate  = rate
+        self._slack = False
+
+    def _set(self, limit: int, why: str):
+        if limit != self.limit:
+            log.debug("Concurrency %d → %d (%s)", self.limit, limit, why)
+            self.limit = limit
+            self._cond.notify_all()
@@ -41,6 +41,12 @@ if [ "$1" = "cli" ]; then
     shift; exec python3 /app/cli.py "$@"
 fi
 
+# ── Batch-job worker (pairs with MR_JOB_RUNNER=external on the API) ────────
+if [ "$1" = "worker" ]; then
+    echo "[worker] Running batch jobs from ${MR_STORE}..."
+    cd /app && exec python3 worker.py
+fi
+
 # ── API-only mode ─────────────────────────────────────────────────────────────
 if [ "$1" = "api" ]; then
     echo "[api] Starting FastAPI on ${API_HOST}:${API_PORT}..."
@@ -8,7 +8,11 @@ import base64
 import os
 import json
 import shutil
+import threading
+import time
+from collections import defaultdict
 from pathlib import Path
+from typing import Dict, Optional
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -45,22 +49,24 @@ for _env, _key in [("TMDB_API_KEY","tmdb_api_key"),("TVDB_API_KEY","tvdb_api_key
         os.environ.setdefault(_env, _s[_key])
 
 try:
-    from core.matcher import MediaMatcher
-    from core.renamer import FileRenamer
+    from core.matcher import MediaMatcher, clear_lookup_cache
+    from core.renamer import FileRenamer, Pipeline, copy_file, move_file
     from core.subtitle_fetcher import SubtitleFetcher
     from core.history import RenameHistory
     from core.presets import PresetManager
-    from core.artwork import ArtworkDownloader
+    from core.artwork import ArtworkDownloader, DOWNLOAD_WORKERS
     from core.metadata_writer import MetadataWriter
+    from core.scanner import iter_media
 except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-    from core.matcher import MediaMatcher
-    from core.renamer import FileRenamer
+    from core.matcher import MediaMatcher, clear_lookup_cache
+    from core.renamer import FileRenamer, Pipeline, copy_file, move_file
     from core.subtitle_fetcher import SubtitleFetcher
     from core.history import RenameHistory
     from core.presets import PresetManager
-    from core.artwork import ArtworkDownloader
+    from core.artwork import ArtworkDownloader, DOWNLOAD_WORKERS
     from core.metadata_writer import MetadataWriter
+    from core.scanner import iter_media
 
 # ── Embedded app icon ────────────────────────────────────────────────────────
 _ICON_B64 = "iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAUVElEQVR42u2d6XtcSXWH+QRkICQkENZhDQTPWJK1dWvzJCQkECB/DyH7vofsZE/IwuAZb+Pdsja3JBuyk+RT9j1MsC2p1bu2m3Oq6nZfeWSru91L9a33PM/79Eh9u6pu3fq9VT0w9qteRVEURVEURVEURVEURVEURVEURVEURVEURVEURVEURVEURVEURVEURVEU1bF66vXfEAEMAqSVkAMgB0IPgAwIPgAiIPgAwYqABwwQqAh4qACBSoCHCRCgBHiAAIGKgIcGELAEeGAAgQqAhwUQqAR4SACBSoCHAxCwBHgwAIEKgIcCELAEeCAAgQqAhwEQsAR4EACBCoCHABCwBHgAAAgAAEITAJMPELAEmHgABAAACAAAEAAAIAAAQAAAkEYBMOkAAUuACQdAADDg7P399zAPCAABhMju332yDvOBABBASOH/20++AuYFASCAIML/iUfC/CAABJDm8H/5E8fCPCEABJBCdr788aZhvhAAAkhT+P/m4y3DvCEABBBo+JEAAkAAaQj/X3/3E8M8IgAEEGj4kQACQAADSO2vPtZxmFcEgAAGIfx/+bGuwfwiAATgdfg/2nWYZwSAAHwM/198tGcw3wiASQ80/EgAASAAj6j++Xf1DeYfAUCg4UcCCAD6Gf4/+05v4HkgAAg0/EgAAUAPqXzpI97C80EA0M3wf/Ej3sNzQgAQaPiRAAKAboT/7ncMHDw3BACBhh8JIADoAOU73z7w8BwRAAQafiSAAKCd8K9/OHXwXBEABBp+JIAAoJnwr3049fCcEQAcQWn124KB540AINDwIwEEAMnw5741WHj+CIDwBw7rAAGEGf7bz7VFuc3P+QzrAQEERVEWfTuUciKAnH1ttw1fYV0ggDDCv/JcW8S7fyXXOAW025avsD4QQMrDf7otSrdPy85/WsJ/OqquPmde9Wf9fbtt+grrBAGkM/zLp1umpEgoyhL0ilCV3b8mAtBX/Vl/r++X2mjbZ1gvCCBVFJbmWqa4PCfBFlbmJOhzTgB6ArCvVgD2fb1Or2+nH19h3SCA4MNffij8NQn/zqp9TUqgjAQQAALwMPyLsy1TXJqVMM9GZaGyouGfi6pCLTcn4Z+Ldo0E7M/V2/Z9vU6v18/p59vp11dYRwggiPAXjwh/9Yjw762dfoUEqkdIoIgEEAAC6FP4F2ZbQsNaUpZc+OUoX5VA125bdnIu/ML+mn01Esg1rtHr9XNGAku2PSOBhXTAukIAA8H2wkxLFBZnJKgzElphecbt/rOyq89KsIXcrNv952T3n4v21+2r/mxPAfY6vV4/Z08Btj1tV9tvdUy+wvpCAH6H/9ZMSxQWXPiFcn33lzCv2FDv1Hd/Cb2w7wSgr3tOCvr+jjkF2M9V3FeIsjkFOAkszLQ8Nl9hnSEAT8M/3TQFZWFawjktIZ2WsM5IcC3VlRkJ84yEejbald19d3VWwj4roZ+NDiT8kXBgJGB/r+/rdTvmxGA/H7el7Wr72o/2V2hhjD7DekMAfoV/frppNIRFZcGFX3boigS1umyprbjwC3s5F37hYM2GP0Z/3ndy0Ot2bzsJrDTa0nbLi04CC7ZfI4H5wYd1hwD8CP/NqaYpzE9FRaF0S1iYisoSyoqEs7o0HdWU5eloRwK8K+zJbr6fsxxIyKM1x3rjn/X38TV6vX5OP6/taHvarrav/Wh/2q/2r+NoZdy+wvpDAH0lL4uwWbY1eBpAE/5495eAalA1sPXdX4Is7Gmw67u/C75yZ67+z/r7+Bq9fve2/XzNSGDGtKvtl91XjZI5Bdhx6HhaGb+vsA4RQH/Cf2OqKbZvPLz72x358O4vwV2eeWj3l4DnZh/a/eecAOYOnQL0Or0+eQrQ9rTd5CnAnAT060fyFNDkffgM6xEB9Dj82abYvpmNCsp8VnberDmCl+UoXlm0VJem7LFf2F0Rbk9LiKfdsX8mipQ1YX3G7f7CXfdqTgHu/VV7vf0qYNvR9naW7dcK7Sfusxx/Fbhlx6Xj03E2e0++ggAQQG/Cfz3bFNuyKAtCUcJVlKCVZMctS/AqEsCqImHU7+k7wq6EdG/Fsi+7+IEEOcolBBB/BbiToP7vAtx1Ofs5/Xzclra74/79gvan/Wr/Oo6SOZHY8ek4dbzN3puvIAAE0OXwZ5pi+0ZGdtaMhCsjQdOdPyuhy0r4shLEbFQz4Z+SHXpKQjolYZ2S4E4bDnLTEmhHffcX7gh3Z+wJ4K77OX7PSMB+Rj8ft6Xtavvaj/an/Wr/Oo7yLTuukpGAHa+Ou9l79BUEgAC6wta1zLHkryUEcCNjdlcjgPmEABamGgJYigUggV1JCMBIIN79EwJIfgW4kwh//RSQEED9FGD7qQvAnAKcAOZjAWTNeOsCaOJefQYBIIAOh3/yWPLXJ6Nt5cak7KaTbvfPSNAslYWM2/2zEkhhOSvhzLrdfyo6UHJTEuQpt/sL64470273F7440/jnO4lr1uKTg21H29N27SnA9qf9av/2FNAYm47TngLs+PU+9H6auW9fQQAIoDPhvzp5LHlZcNtCQUJTkAAVZSctSaDKEqyKIiGryq5bE3YkfLtLlj3ZnfcloAdCJGGNVADxV4C1hATuJL4CxAKIf7eeuHbVnR5ytj1tV9vXfuI+tf+aOYlkzbh0fDpOHW/RnFzsfej96H01c/++ggAQwJOF/8rkseSvuvALxes2RCWhfNOGqypH7OotF35hVwK4J8dxZX/Zhd8IIA5vUgDJ4/+jBBB/DUgKYNq25+Si/cR9av87TkY6Lh2fkcBNO24dv95HwUlN76+ZefAVBIAA2mLzysRj2VKuTsguOSFBmTC7ZvGGpSRH6fL8pBWA2f0zEriM7L4Zu/Ob3T8ru3NWAppN7P7uK8DaVGL3j78CTNvwx9xNvFc/BbjPx22ZU4DtR/vbq58C7Hh0XNX6KcCOO74Hewqw96f3uXXMfPgMAkAArYX/8sRj0TDklasu/Gb3lwDdsJRvuvALtVsu/ILd/SWQyrIL/6HjfyyA6SMEMPOQAGaOEMD0KwRgTwG2v30nH3sKsOPS8VXdVxUdd3wPej/2FGDvM++kd9zc+AoCQABNhn/8sWxdGZcwjEfbV4Vr4xKSCQnLhIRmIiorNyckTJMSqkkJ16QEzbIru+7eUkZCmIkOloWVjIRTd38h51jNut1fWBfuOMzu7/hS4p/NKcBdsz7V+Oxqok1t35w0bL/av45DxxOPTcdZNSeWSTN+vQ+9H72vgjnh2PvV+9b7P26OfAUBIIDHh//SeFNsyWLKX26IoCA7ZFGCUrpu0QBVZDetCrVYBMKu7Lh7Erz9xYYIouVsQwSxDFYTXwXWYxm4wMeYnT8R/PgzuURb2q6eNFzwtV/tX8eh49Fx6fh0nDpeE3x3D3o/el9x8PV+9b6bnSNfQQAI4BHhH2uJLeXymIRjLNoWChKU4jVL6fq4hGk8qkigqrKjVucnJGgTEroJCd9ktKcsTkooJ6MDIVIRrDhuC7lM4kTgWM82dnuz4yfeq+/47vNxW3rSWLL9aH/ar/av49Dx6Lh0fBVzerHjju9B70fvS+9P73OrxfnxGQSAAA6x8dJY22zGIrisIohPBAkR1E8ENmxWBPGJwIlgUUUQnwgSIrid+GqwmhDBWuJ39R0/EXoT/IxpV9u3obfU4tC7o37Z7PiJ0Jvgj5v70fvS+3uS+fEVBIAAnjj8hyRwyUrAnggSEqifCCbqJ4LafEME8Ylgv34iyBxxIsgePhEc+o7/8I6fMe3sH9rxJ+t9NnZ8G/zSoR1/3Iw/n9jx0xj+NEoAAbQT/oujHWPzpdFoS7k0KgEajbYlRAUJU/GqpXRtTHZb+VogVOW4Xb05HtWEHQnlrhzJ95SFCQnuRHQg4Y3MVwPHyqQ7EWQax3wT/MQ1Kg9zmrDtaHvarrav/Wh/2m/FnErGzXjisek4t80pxo5f70Pvp5Pz4ysIIFABbFwY7TibykUboLywLTto4bKlKCErSdjKstNWrjkRCDUJ5Y7syrvKvA3uvnAgO3e06KjLoLHTx6GPr9Hr951ItB1tT9vV9qtOPNqv9q/j0PHEY9Nx5p3AdPybXZgbn0EAgQlg48KprrJ58ZSE6ZSE6pSES08DoxK0UQndqIRvVEIoIpAduHJ9TMI5JiEdk7COG3bnxyXE4xLmcQm1ngYmJODCkrA84UTgfl607+t1er1+Tj8ft6Xtavvaj/an/Wr/Oo7CZTsuHZ+OU8er4+723PgKAghEAA/On+oJRgTCVl0GNmxGBHUZ2FBWrtmgWhk4EQh7dRnYkEeLDWzoJ8z7et1uPfTj9bYq9dCPmf6KTkQ29KNmXDq+TReCXs2NryCAlAvgwfmRnrJxYUTCJVwckbCNuBPBKQmhpXjllDsRjEpYheujEtxRdyIYk1AL82MS8jF3IhiX8NtXu+Pb9/U6vd7u+LYdbU/btTt+o0/t3+74dlw6Ph1nr+fGVxBASgXw4NxIX9hQztugbQl52XG3X7IUJIxFCWVJduXyFScCoSrhrckOvqPcsAHfE/Zlpz/QE4GeDJwg9H29Tq/Xz1WcULS9kjlt2H7iPrX/LScmHddGn+bFZxBAygTgw6J6WAL5IyRQOkICtSMkkAx/7Yjwl44If/6I8BP29EgAATwq/GeHvWHj3HC0KWydFy4MR3kJ4rYcwwtyHC8ql0YkuKeislCRY3v1qqUm4d6RY/2usHfDvurP+vv4Gr2+bERyyrSj7Wm72n7eiMf2q/3rOHyaF19BAAMugPvyEH3jgQvghoZRQ2lOBBLUlywFDa8LcllDreHWkJsTgQv+9VG349v39ToTfLPjN9rSdu2Ob/szwT837OW8+AoCGFAB3H9xyFseKGeHJJBDsiMPmZ05f8GyfXFYdu5hs4OXzIlgRHb2EdnhR+xpoL7j29/r+6X6jm8/H7dld3zbj/b3wOM58RkEMGACuP/C0ECggdyQYG4KW+6rQV7YlvAWJMjFiyN1EZSFihOBvurPcfD1Or1eP6efN18x9OvGWdu+Cf4L8CQggAERwP0XTg4UD148GW0Im2eFcycluEMS4iEJ81BUUC4OSciHo5JQvjQs4bevJXNKGDbv63V6vX5uy5wqbHvarrY/aHPiKwjAcwHcO3NyIDEiiGWgIjg7VBdBXQbmROCCf3HY7fiNa0zwzY5v23ngFu2gzomvIABPBTDoC+v+mYdPBDbUh08ELvwXhg/t+PXwJ3d8whqUBIIWwL0vPJsa7p95VnbvZ6MNYdN9NdgS8nKs3z5/MiqoDM7bn7fOuq8OKo0X7Of082maD19BAIS/uxI4YyWw8aIVQV0C5xLhN6cFe51eT/jDlUCQArj3/DOp5f4XnokeKGeekYA/E21KyLck7Ftn7eumOSXY9/U6vT7N8+ErCKBPfFUmP+2YRabhPhOLQE8D8Y5vf3/PBf+r0DcQQK/D//kTQXHv+ROyw5+Qnf5EtGF2fPuz/j60ufAVBED4uy+B560E9JXwI4FwTwB/eiJI7skiu/95+xrqHPgKJ4BeS+BPPhQk9wK9b5/h3wH0if+TyQfoJ/yvAP2WwB9/C0Bf4P8HgASA8CMALyTwRx8E6An8twCe/hdRLE4IMfwIIMHLn/sgQFfgzwMYkD8R6OXPfQCgo/AnAg3Ynwn48h9+AKAj8GcCDuifCvzyH3wzwBPBnwo84H8vwFfkIQK0A38vQEr+ZqCv/P77AVqCvxkoZX83IIsa0hp+BNCsBH7v/QCPhb8dOMUCsBJ4H8CRDPK6RgAt8L+/+z6AQwz6mkYALUvgvQCGNKxnBNCOBH7nvRA4aVnLCKBdCfz2eyBQ0rSOEQASgEDDjwA6wP/81nsgENK4fhFARyTwbkg5aV27CKBTEvjNd0NKSfO6RQAdlcC7IGWkfc0igE5L4LPvgpQQwnpFAF3gvz/7NAw4oaxVBNAtCfzG0zCghLROEUA3JfDrT8OAEdoaRQBdl8A7YUAIcX0igB7wX7/2TvCcUNcmAuiZBN4BnhLyukQAvZTAr74DPCP0NYkAei6Bt4MnsB4RQH8k8Ctvhz7DOkQAfeU/ZRFCf2D9IQA/JPDLb4Mew7pDAH5J4JfeBj2C9YYAPJXAW6HLsM4QgN8S+MxboUuwvhDAQPAfn3kLdBjWFQIYLAn84lugQ7CeEAASIPyAAAZQAr/wTdAmrB8EgAQIPyCAwefff/7N0CSsFwSQTgn83JvhGFgnCCDlEngTPALWBwIIQwI/+yZ4CNYFAgiKf5NFDxbWAwIIUwI/843BwzpAAEiA8AMCCFgCPx0ePHcEAIFKgOeNAOAI/vWn3ph6eM4IAB4ngZ98Y2rh+SIACFQCPFcEAK1I4Ce+PjXwPBEABCoBniMCgCfgX3786wYWnh8CgEAlwHNDANBJCfzYGwYGnhcCgEAlwHNCANBNCfzoG7yF54MAoAf88498rXfwXBAABCoBngcCgH5I4Idf33d4DggAApUA848AwAP+6Yde13OYdwQAgUqA+UYATLqPEvjB13Ud5hkBIACvJfBU12B+EQACGAQJ/MBTHYd5RQAIYID4x+//mo7BfCIABBCoBJhHBIAABlkC3/fatmH+EAACCFQCzBsCQABpksCnX9s0zBcCQAAp5B8+/ZpjYZ4QAAJIswS+9zWPhPlBAAggCAm8+hUwLwgAAYQkgU+9ug7zgQAQQKASYB4QAAIAQAAIAAABIAEAwo8AABAAAgBAAAgAAAEgAAAEgAAAEACTDxCqAJAAQMDhRwAACICHABCqAJAAQMDhRwAAgQsACQAEHH4EABC4AJAAQMDhRwAAgQsACQAEHH4kABB4+JEAQODhRwAAgQsACQAEHH5EABB48JEAAOFHAgChhx8RAAQefEQAQPARAQDBRwZA6CnkAIScoiiKoiiKoiiKoiiKoiiKoiiKoiiKoiiKoiiKoiiKoiiKoiiKoijq8fX/DzLFiP8K0K4AAAAASUVORK5CYII="
@@ -222,11 +228,16 @@ QLabel#stat_dim { color: #6B7280; font-size: 11px; }
 
 class MatchWorker(QThread):
     progress   = pyqtSignal(int)
-    matched    = pyqtSignal(int, object, str)
+    matched    = pyqtSignal(list)        # [(index, match_info, new_name), …]
     status     = pyqtSignal(str)
     finished   = pyqtSignal(int, int)
     hard_error = pyqtSignal(str)
 
+    # Results reach the UI in batches — every FLUSH_EVERY files or FLUSH_SECS,
+    # whichever comes first — so the lists repaint once per batch, not per file
+    FLUSH_EVERY = 25
+    FLUSH_SECS  = 0.25
+
     def __init__(self, files, data_source, naming_scheme, matcher, renamer):
         super().__init__()
         self.files = files; self.data_source = data_source
@@ -235,27 +246,66 @@ class MatchWorker(QThread):
 
     def run(self):
         total = len(self.files); matched_count = 0
-        for i, fp in enumerate(self.files):
+        rows = []; lines = []; last = time.monotonic()
+        # Files are matched concurrently and reported as each one finishes
+        results = self.matcher.iter_matches(self.files, self.data_source, extract_media_info=True)
+        for done, (i, mi, exc) in enumerate(results, 1):
+            fp = self.files[i]; name = os.path.basename(fp)
             try:
-                mi = self.matcher.match_file(fp, self.data_source, extract_media_info=True)
+                if exc:
+                    raise exc
                 if mi:
                     nn = self.renamer.generate_new_name(fp, mi, self.naming_scheme)
                     matched_count += 1
-                    self.status.emit(f"\u2713  {os.path.basename(fp)}  \u2192  {mi.get('title','?')} ({mi.get('year','')})")
+                    lines.append(f"\u2713  {name}  \u2192  {mi.get('title','?')} ({mi.get('year','')})")
                 else:
-                    nn = f"[no match]  {os.path.basename(fp)}"
-                    self.status.emit(f"\u2717  No match: {os.path.basename(fp)}")
-                self.matched.emit(i, mi, nn)
+                    nn = f"[no match]  {name}"
+                    lines.append(f"\u2717  No match: {name}")
+                rows.append((i, mi, nn))
             except Exception as e:
                 err = str(e)
-                self.status.emit(f"\u26a0  {os.path.basename(fp)}: {err}")
-                self.matched.emit(i, None, f"[error]  {os.path.basename(fp)}")
+                lines.append(f"\u26a0  {name}: {err}")
+                rows.append((i, None, f"[error]  {name}"))
                 if not self._hard_error_fired:
                     self._hard_error_fired = True
+                    self._flush(rows, lines, done, total); rows = []; lines = []
                     self.hard_error.emit(err)
-            self.progress.emit(int((i+1)/total*100))
+            now = time.monotonic()
+            if rows and (len(rows) >= self.FLUSH_EVERY or now - last >= self.FLUSH_SECS):
+                self._flush(rows, lines, done, total); rows = []; lines = []; last = now
+        if rows:
+            self._flush(rows, lines, total, total)
         self.finished.emit(matched_count, total)
 
+    def _flush(self, rows, lines, done, total):
+        # Fresh lists after every flush: queued signals hold a reference, not a copy
+        self.status.emit("\n".join(lines))
+        self.matched.emit(rows)
+        self.progress.emit(int(done/total*100))
+
+
+class FolderScanWorker(QThread):
+    """Walks folders for media files off the UI thread, in batches."""
+    found = pyqtSignal(list)
+    done  = pyqtSignal(int)     # total found; QThread.finished still follows
+
+    BATCH = 100
+
+    def __init__(self, folders):
+        super().__init__()
+        self.folders = folders
+
+    def run(self):
+        total = 0; batch = []
+        for folder in self.folders:
+            for path in iter_media(folder):
+                batch.append(path)
+                if len(batch) >= self.BATCH:
+                    self.found.emit(sorted(batch)); total += len(batch); batch = []
+        if batch:
+            self.found.emit(sorted(batch)); total += len(batch)
+        self.done.emit(total)
+
 
 class RenameWorker(QThread):
     progress           = pyqtSignal(int)
@@ -277,66 +327,98 @@ class RenameWorker(QThread):
             artwork_dl  = ArtworkDownloader() if self.download_artwork else None
             meta_wr     = MetadataWriter()    if self.write_metadata   else None
             total       = len(self.files)
-            renamed     = 0
-            skipped     = 0
-            conflicts   = 0
+            counts      = {"renamed": 0, "skipped": 0, "conflicts": 0}
 
             mode_label = "DRY RUN" if self.dry_run else ("COPY" if self.copy_mode else "MOVE")
 
-            for i, (fp, mi) in enumerate(zip(self.files, self.matches)):
-                if not mi:
-                    self.progress.emit(int((i+1)/total*100))
-                    continue
-
-                new_name  = renamer.generate_new_name(fp, mi, self.naming_scheme)
-                dest_base = Path(self.output_dir) if self.output_dir else Path(fp).parent
-                dest      = dest_base / new_name
-                dest.parent.mkdir(parents=True, exist_ok=True)
-
-                if dest.exists() and dest != Path(fp):
-                    conflicts += 1
-                    self.status.emit(f"\u26a0  [{mode_label}] Conflict — destination exists: {dest.name}")
-                    self.progress.emit(int((i+1)/total*100))
-                    continue
+            def renamed():
+                """Rename files one by one (so destination checks stay ordered),
+                handing each moved file on to the artwork/metadata stages."""
+                for i, (fp, mi) in enumerate(zip(self.files, self.matches)):
+                    if not mi:
+                        self.progress.emit(int((i+1)/total*100))
+                        continue
+
+                    src       = Path(fp)
+                    new_name  = renamer.generate_new_name(fp, mi, self.naming_scheme)
+                    dest_base = Path(self.output_dir) if self.output_dir else src.parent
+                    dest      = dest_base / new_name
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+
+                    if dest.exists() and dest != src:
+                        counts["conflicts"] += 1
+                        self.status.emit(f"\u26a0  [{mode_label}] Conflict — destination exists: {dest.name}")
+                        self.progress.emit(int((i+1)/total*100))
+                        continue
+
+                    if self.dry_run:
+                        self.status.emit(f"\u25b6  [DRY RUN] {src.name} \u2192 {dest.name}")
+                        counts["renamed"] += 1
+                        self.progress.emit(int((i+1)/total*100))
+                        continue
+
+                    try:
+                        if self.copy_mode:
+                            copy_file(fp, str(dest))
+                        else:
+                            move_file(fp, str(dest))
+
+                        counts["renamed"] += 1
+                        self.status.emit(f"\u2713  [{mode_label}] {src.name} \u2192 {dest.name}")
+                        # History first: undo works while posters are still downloading
+                        self.operation_complete.emit(fp, str(dest), mi)
+                        yield dest, mi
+
+                    except Exception as e:
+                        counts["skipped"] += 1
+                        self.status.emit(f"\u2717  Failed: {src.name} — {e}")
 
-                if self.dry_run:
-                    self.status.emit(f"\u25b6  [DRY RUN] {os.path.basename(fp)} \u2192 {dest.name}")
-                    renamed += 1
                     self.progress.emit(int((i+1)/total*100))
-                    continue
-
-                try:
-                    if self.copy_mode:
-                        shutil.copy2(fp, str(dest))
-                    else:
-                        shutil.move(fp, str(dest))
-
-                    renamed += 1
-                    self.status.emit(f"\u2713  [{mode_label}] {os.path.basename(fp)} \u2192 {dest.name}")
 
-                    if artwork_dl:
-                        p = artwork_dl.download_poster(mi, str(dest.parent))
+            # A season's episodes share one folder and one poster: download it once
+            posters: Dict[tuple, Optional[str]] = {}
+            poster_locks: Dict[tuple, threading.Lock] = defaultdict(threading.Lock)
+            locks_lock = threading.Lock()
+
+            def artwork(job):
+                dest, mi = job
+                key = (str(dest.parent), mi.get('tmdb_id'), mi.get('title'))
+                with locks_lock:
+                    lock = poster_locks[key]
+                with lock:
+                    if key not in posters:
+                        with artwork_dl.limit:   # adaptive share of the stage's threads
+                            posters[key] = p = artwork_dl.download_poster(mi, str(dest.parent))
                         if p: self.status.emit(f"   \U0001f5bc  Poster: {os.path.basename(p)}")
+                return job
+
+            def metadata(job):
+                dest, mi = job
+                poster = None
+                if artwork_dl:
+                    c = dest.parent / f"{mi.get('title','Unknown')}_poster.jpg"
+                    poster = str(c) if c.exists() else None
+                if meta_wr.write_metadata(str(dest), mi, poster):
+                    self.status.emit(f"   \U0001f3f7  Metadata written")
+                return job
+
+            # Posters and tags for earlier files are fetched/written while
+            # later files are still being renamed; downloads wait on the
+            # network, so that stage gets more threads than tagging
+            stages = [(stage, n) for stage, n, on in ((artwork, DOWNLOAD_WORKERS, artwork_dl),
+                                                      (metadata, 4, meta_wr)) if on]
+            if stages:
+                pipeline = Pipeline(*(s for s, _ in stages), workers=[n for _, n in stages])
+                for (dest, _), _, exc in pipeline.run(renamed()):
+                    if exc:
+                        self.status.emit(f"\u26a0  {dest.name}: {exc}")
+            else:
+                for _ in renamed():
+                    pass
 
-                    if meta_wr:
-                        poster = None
-                        if artwork_dl:
-                            c = dest.parent / f"{mi.get('title','Unknown')}_poster.jpg"
-                            poster = str(c) if c.exists() else None
-                        if meta_wr.write_metadata(str(dest), mi, poster):
-                            self.status.emit(f"   \U0001f3f7  Metadata written")
-
-                    self.operation_complete.emit(fp, str(dest), mi)
-
-                except Exception as e:
-                    skipped += 1
-                    self.status.emit(f"\u2717  Failed: {os.path.basename(fp)} — {e}")
-
-                self.progress.emit(int((i+1)/total*100))
-
-            parts = [f"{renamed} renamed"]
-            if conflicts: parts.append(f"{conflicts} conflict(s) skipped")
-            if skipped:   parts.append(f"{skipped} error(s)")
+            parts = [f"{counts['renamed']} renamed"]
+            if counts["conflicts"]: parts.append(f"{counts['conflicts']} conflict(s) skipped")
+            if counts["skipped"]:   parts.append(f"{counts['skipped']} error(s)")
             suffix = " (dry run — no files changed)" if self.dry_run else ""
             self.finished.emit(True, "Done — " + ", ".join(parts) + suffix)
 
@@ -418,7 +500,11 @@ class SettingsDialog(QDialog):
         note = QLabel("* Required for file matching.")
         note.setStyleSheet("color: #6B7280; font-size:11px;"); layout.addWidget(note)
 
-        btns = QHBoxLayout(); btns.addStretch()
+        btns = QHBoxLayout()
+        clear_cache = QPushButton("Clear Lookup Cache"); clear_cache.setObjectName("ghost")
+        clear_cache.setToolTip("Forget cached TMDB results so the next match queries TMDB again")
+        clear_cache.clicked.connect(self._clear_cache)
+        btns.addWidget(clear_cache); btns.addStretch()
         cancel = QPushButton("Cancel"); cancel.setObjectName("ghost"); cancel.clicked.connect(self.reject)
         save = QPushButton("Save Keys"); save.setObjectName("match"); save.clicked.connect(self._save)
         btns.addWidget(cancel); btns.addWidget(save)
@@ -524,6 +610,10 @@ class SettingsDialog(QDialog):
 
         outer.addWidget(tabs)
 
+    def _clear_cache(self):
+        clear_lookup_cache()
+        QMessageBox.information(self, "Lookup Cache", "Cached TMDB results were cleared.")
+
     def _toggle_echo(self, show):
         m = QLineEdit.EchoMode.Normal if show else QLineEdit.EchoMode.Password
         for f in (self.tmdb_field, self.tvdb_field, self.osub_field): f.setEchoMode(m)
@@ -943,7 +1033,7 @@ class MediaRenamerApp(QMainWindow):
         self.setWindowTitle("MediaRenamer")
         self.setWindowIcon(_app_icon())
         self.setMinimumSize(960, 660); self.resize(1380, 840)
-        self.files=[]; self.matches=[]
+        self.files=[]; self._files_set=set(); self.matches=[]; self._scan_workers=[]
         self.matcher=MediaMatcher(); self.renamer=FileRenamer()
         self.history=RenameHistory(); self.preset_manager=PresetManager()
         self._build_ui()
@@ -1078,6 +1168,7 @@ class MediaRenamerApp(QMainWindow):
         self.original_list.setDragDropMode(QAbstractItemView.DragDropMode.DropOnly)
         self.original_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.original_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.original_list.setUniformItemSizes(True)
         self.original_list.customContextMenuRequested.connect(self._file_context_menu)
         self.file_stack.addWidget(self.drop_zone)
         self.file_stack.addWidget(self.original_list)
@@ -1110,7 +1201,11 @@ class MediaRenamerApp(QMainWindow):
         self.preset_combo.setFixedWidth(160)
         self.preset_combo.currentTextChanged.connect(self.load_preset)
         self.naming_scheme_input = QLineEdit("{n}.{y}.{vf}.{vc}.{af}")
-        self.naming_scheme_input.textChanged.connect(self._refresh_preview)
+        # Re-render once typing pauses, not on every keystroke
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True); self._preview_timer.setInterval(150)
+        self._preview_timer.timeout.connect(self._refresh_preview)
+        self.naming_scheme_input.textChanged.connect(self._preview_timer.start)
         self.naming_scheme_input.setToolTip(
             "{n} title  \u00b7  {y} year  \u00b7  {vf} resolution  \u00b7  {vc} video codec\n"
             "{af} audio format  \u00b7  {ac} audio channels\n"
@@ -1181,6 +1276,7 @@ class MediaRenamerApp(QMainWindow):
 
         self.new_names_list = QListWidget()
         self.new_names_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.new_names_list.setUniformItemSizes(True)
         self.new_names_list.customContextMenuRequested.connect(self._preview_context_menu)
         v.addWidget(self.new_names_list, stretch=1)
 
@@ -1284,11 +1380,10 @@ class MediaRenamerApp(QMainWindow):
         if not ok or not query.strip(): return
 
         # Simple search — strip year from end if provided
-        import re
         parts = query.strip().rsplit(None, 1)
         year = None
         title = query.strip()
-        if len(parts) == 2 and re.match(r'^\d{4}$', parts[1]):
+        if len(parts) == 2 and len(parts[1]) == 4 and parts[1].isdigit():
             title = parts[0]; year = int(parts[1])
 
         results = self.matcher.search_movies(title, year) or self.matcher.search_tv_shows(title)
@@ -1329,37 +1424,62 @@ class MediaRenamerApp(QMainWindow):
 
     def add_folder(self):
         folder = QFileDialog.getExistingDirectory(self,"Select Folder")
-        if not folder: return
-        exts = {'.mp4','.mkv','.avi','.mov','.m4v','.mpg','.mpeg','.flv','.wmv'}
-        found = [str(p) for p in Path(folder).rglob("*") if p.suffix.lower() in exts]
-        if found: self.add_files_list(sorted(found))
-        else: self._log("\u26a0  No media files found in selected folder.")
-
-    def add_files_list(self, paths):
-        added = 0
+        if folder: self._scan_folders([folder])
+
+    def _scan_folders(self, folders):
+        """Add the media files under *folders*, listed as the walk finds them."""
+        self._log("\u27f3  Scanning folder\u2026")
+        worker = FolderScanWorker(folders); worker.added = 0
+        worker.found.connect(lambda batch: self._on_scan_batch(worker, batch))
+        worker.done.connect(lambda total: self._on_scan_done(worker, total))
+        # Keep a reference until the thread has really exited: a QThread
+        # collected while still running aborts the app
+        worker.finished.connect(lambda: self._release_scan_worker(worker))
+        self._scan_workers.append(worker); worker.start()
+
+    def _on_scan_batch(self, worker, batch):
+        worker.added += self.add_files_list(batch, announce=False)
+
+    def _release_scan_worker(self, worker):
+        worker.wait()
+        self._scan_workers.remove(worker)
+
+    def _on_scan_done(self, worker, total):
+        if not total: self._log("\u26a0  No media files found in selected folder.")
+        elif worker.added: self._log(f"+ Added {worker.added} file(s)")
+
+    def add_files_list(self, paths, announce=True):
+        new = []; folders = []
         for path in paths:
             if os.path.isdir(path):
-                exts = {'.mp4','.mkv','.avi','.mov','.m4v','.mpg','.mpeg','.flv','.wmv'}
-                for p in sorted(Path(path).rglob("*")):
-                    if p.suffix.lower() in exts and str(p) not in self.files:
-                        self.files.append(str(p)); self._add_file_item(str(p)); added+=1
-            elif path not in self.files:
-                self.files.append(path); self._add_file_item(path); added+=1
-        if added:
-            self.matches.extend([None]*added)
-            self._log(f"+ Added {added} file(s)"); self._refresh_ui()
-
-    def _add_file_item(self, path):
-        item = QListWidgetItem(os.path.basename(path))
-        item.setToolTip(path); item.setForeground(QColor(C_TEXT_MID))
-        self.original_list.addItem(item)
+                folders.append(path)
+            elif path not in self._files_set:
+                self._files_set.add(path); new.append(path)
+        if folders: self._scan_folders(folders)
+        if new:
+            self.files.extend(new); self._add_file_items(new)
+            self.matches.extend([None]*len(new))
+            if announce: self._log(f"+ Added {len(new)} file(s)")
+            self._refresh_ui()
+        return len(new)
+
+    def _add_file_items(self, paths):
+        # One repaint for the whole batch instead of one per row
+        self.original_list.setUpdatesEnabled(False)
+        try:
+            for path in paths:
+                item = QListWidgetItem(os.path.basename(path))
+                item.setToolTip(path); item.setForeground(QColor(C_TEXT_MID))
+                self.original_list.addItem(item)
+        finally:
+            self.original_list.setUpdatesEnabled(True)
 
     def remove_selected(self):
         rows = sorted([self.original_list.row(i) for i in self.original_list.selectedItems()], reverse=True)
         if not rows: return
         for r in rows:
             self.original_list.takeItem(r)
-            self.files.pop(r)
+            self._files_set.discard(self.files.pop(r))
             if r < len(self.matches): self.matches.pop(r)
             if r < self.new_names_list.count(): self.new_names_list.takeItem(r)
         self._log(f"\u2212  Removed {len(rows)} file(s)")
@@ -1378,7 +1498,7 @@ class MediaRenamerApp(QMainWindow):
         if n == 0: self.stat_matched.setText("—"); self.stat_matched.setObjectName("stat_dim")
 
     def clear_files(self):
-        self.files.clear(); self.matches.clear()
+        self.files.clear(); self._files_set.clear(); self.matches.clear()
         self.original_list.clear(); self.new_names_list.clear()
         self.rename_btn.setEnabled(False)
         self._refresh_ui(); self._log("\u2014 List cleared")
@@ -1441,29 +1561,38 @@ class MediaRenamerApp(QMainWindow):
         self.progress_bar.setVisible(True); self.progress_bar.setValue(0)
         self.matches = [None]*len(self.files)
         self.new_names_list.clear()
-        for _ in self.files:
-            item = QListWidgetItem("\u2026"); item.setForeground(QColor(C_TEXT_DIM))
-            self.new_names_list.addItem(item)
+        self.new_names_list.setUpdatesEnabled(False)
+        try:
+            for _ in self.files:
+                item = QListWidgetItem("\u2026"); item.setForeground(QColor(C_TEXT_DIM))
+                self.new_names_list.addItem(item)
+        finally:
+            self.new_names_list.setUpdatesEnabled(True)
 
         self.match_worker = MatchWorker(
             self.files, self.data_source_combo.currentText(),
             self.naming_scheme_input.text(), self.matcher, self.renamer)
         self.match_worker.progress.connect(self.progress_bar.setValue)
         self.match_worker.status.connect(self._log)
-        self.match_worker.matched.connect(self._on_match_result)
+        self.match_worker.matched.connect(self._on_match_results)
         self.match_worker.finished.connect(self._on_match_finished)
         self.match_worker.hard_error.connect(self._on_match_hard_error)
         self.match_worker.start()
 
-    def _on_match_result(self, idx, mi, nn):
-        self.matches[idx] = mi
-        item = self.new_names_list.item(idx); item.setText(nn)
-        if mi:
-            item.setForeground(QColor(C_TEXT))
-        elif "[error]" in nn:
-            item.setForeground(QColor(C_ERROR))
-        else:
-            item.setForeground(QColor(C_TEXT_DIM))
+    def _on_match_results(self, rows):
+        self.new_names_list.setUpdatesEnabled(False)
+        try:
+            for idx, mi, nn in rows:
+                self.matches[idx] = mi
+                item = self.new_names_list.item(idx); item.setText(nn)
+                if mi:
+                    item.setForeground(QColor(C_TEXT))
+                elif "[error]" in nn:
+                    item.setForeground(QColor(C_ERROR))
+                else:
+                    item.setForeground(QColor(C_TEXT_DIM))
+        finally:
+            self.new_names_list.setUpdatesEnabled(True)
         self._update_stats()
 
     def _on_match_hard_error(self, error_msg):
@@ -1496,12 +1625,12 @@ class MediaRenamerApp(QMainWindow):
     def fetch_subtitles(self):
         if not self.files: QMessageBox.warning(self,"No Files","Please add files first."); return
         self._log("\u27f3  Fetching subtitles\u2026"); fetcher = SubtitleFetcher()
-        for fp in self.files:
-            try:
-                sub = fetcher.fetch_subtitle(fp)
+        try:
+            # Files are looked up concurrently and logged as each one finishes
+            for fp, sub in fetcher.fetch_subtitles(self.files):
                 self._log(f"\u2b07  {os.path.basename(sub)}" if sub else f"\u2717  No subtitle: {os.path.basename(fp)}")
-            except Exception as e:
-                self._log(f"\u26a0  {os.path.basename(fp)}: {e}")
+        except Exception as e:
+            self._log(f"\u26a0  Subtitles: {e}")
 
     # ── Rename ────────────────────────────────────────────────────
     def rename_files(self):
@@ -1578,24 +1707,30 @@ class MediaRenamerApp(QMainWindow):
             self.naming_scheme_input.blockSignals(True)
             self.naming_scheme_input.setText(s)
             self.naming_scheme_input.blockSignals(False)
-            self._refresh_preview()
+            self._preview_timer.stop(); self._refresh_preview()
 
     def _refresh_preview(self):
         """Re-render the RENAMED PREVIEW list using cached match data + current scheme."""
         if not self.files or not hasattr(self, 'matches') or not self.matches:
             return
         scheme = self.naming_scheme_input.text().strip() or "{n} ({y})"
-        for idx, (fp, mi) in enumerate(zip(self.files, self.matches)):
-            item = self.new_names_list.item(idx)
-            if item is None:
-                continue
-            if mi:
-                try:
-                    nn = self.renamer.generate_new_name(fp, mi, scheme)
-                    item.setText(nn)
-                    item.setForeground(QColor(C_TEXT))
-                except Exception:
-                    pass  # keep existing text on error
+        color  = QColor(C_TEXT)
+        self.new_names_list.setUpdatesEnabled(False)
+        try:
+            for idx, (fp, mi) in enumerate(zip(self.files, self.matches)):
+                item = self.new_names_list.item(idx)
+                if item is None:
+                    continue
+                if mi:
+                    try:
+                        nn = self.renamer.generate_new_name(fp, mi, scheme)
+                    except Exception:
+                        continue  # keep existing text on error
+                    if item.text() != nn:
+                        item.setText(nn)
+                    item.setForeground(color)
+        finally:
+            self.new_names_list.setUpdatesEnabled(True)
 
     def save_current_preset(self):
         scheme = self.naming_scheme_input.text().strip()
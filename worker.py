@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Standalone batch-job worker for MediaRenamer.
+
+When the API is started with MR_JOB_RUNNER=external it only enqueues jobs;
+this process claims pending jobs from the shared store, runs them and
+writes progress back, so long renames never compete with request handling.
+Run as many workers as you like — each job is claimed by exactly one.
+
+Usage:
+  MR_STORE=redis://localhost:6379/0 python worker.py
+"""
+
+import logging
+import os
+import sys
+import time
+
+# Ensure project root is on path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from api.jobs import Job, queue
+from api.models import JobStatus
+from api.store import get_store
+
+POLL_INTERVAL = 1.0   # seconds between checks for new jobs / cancels
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    store = get_store()
+    if not store.shared:
+        sys.exit("worker.py needs a shared job store — set MR_STORE=redis://...")
+    logging.info("Worker polling %s for jobs", store)
+
+    while True:
+        try:
+            for snap in store.load_all():
+                if snap.get("status") == JobStatus.PENDING.value and store.claim(snap["job_id"]):
+                    logging.info("Claimed job %s", snap["job_id"])
+                    queue.adopt(Job.from_detail(snap, interrupted=False))
+            # Progress and cancels reach the store via the queue's batched
+            # flusher; finished jobs are flushed once more and then dropped
+            queue.poll_cancellations()
+            queue.release_finished()
+        except Exception as exc:
+            logging.warning("Job store poll failed: %s", exc)
+        time.sleep(POLL_INTERVAL)
+
+
+if __name__ == "__main__":
+    main()